@@ -9,12 +9,9 @@ which reduces memory consumption.
 
 import py_hakka_json
 
-json_obj = py_hakka_json.HakkaJsonObject()
-
-# Add some key-value pairs
-json_obj["name"] = "John Doe"
-json_obj["age"] = 30
-json_obj["is_student"] = False
+json_obj = py_hakka_json.HakkaJsonObject(
+    {"name": "John Doe", "age": 30, "is_student": False}
+)
 
 # Access values
 name = json_obj["name"]
@@ -1,21 +1,31 @@
 """
-This module is the entry point for the hakka_json package. It imports all the
+This module is the entry point for the hakka_json package. It exposes all the
 public classes and functions that are available from the package. The classes
-and functions are imported from the other modules in the package.
+and functions are imported lazily from the other modules in the package.
 """
 
 __version__ = "1.0.0"
 
-from ._hakka_json_base import HakkaJsonBase, HakkaJsonIteratorBase
-from ._hakka_json_int import HakkaJsonInt
-from ._hakka_json_float import HakkaJsonFloat
-from ._hakka_json_bool import HakkaJsonBool
-from ._hakka_json_null import HakkaJsonNull
-from ._hakka_json_invalid import HakkaJsonInvalid
-from ._hakka_json_string import HakkaJsonString, HakkaJsonStringIterator
-from ._hakka_json_array import HakkaJsonArray, HakkaJsonArrayIterator
-from ._hakka_json_object import HakkaJsonObject, HakkaJsonObjectIterator
-from ._hakka_json import HakkaJson
+import importlib
+
+# Public names are resolved on first access (PEP 562), so importing the
+# package does not load every type module up front.
+_LAZY_IMPORTS = {
+    "HakkaJsonBase": "._hakka_json_base",
+    "HakkaJsonIteratorBase": "._hakka_json_base",
+    "HakkaJsonInt": "._hakka_json_int",
+    "HakkaJsonFloat": "._hakka_json_float",
+    "HakkaJsonBool": "._hakka_json_bool",
+    "HakkaJsonNull": "._hakka_json_null",
+    "HakkaJsonInvalid": "._hakka_json_invalid",
+    "HakkaJsonString": "._hakka_json_string",
+    "HakkaJsonStringIterator": "._hakka_json_string",
+    "HakkaJsonArray": "._hakka_json_array",
+    "HakkaJsonArrayIterator": "._hakka_json_array",
+    "HakkaJsonObject": "._hakka_json_object",
+    "HakkaJsonObjectIterator": "._hakka_json_object",
+    "HakkaJson": "._hakka_json",
+}
 
 __all__ = [
     "__version__",
@@ -35,3 +45,16 @@ __all__ = [
     "HakkaJsonArrayIterator",
     "HakkaJsonObjectIterator",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
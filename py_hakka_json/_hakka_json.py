@@ -3,11 +3,128 @@ HakkaJson Type Interface.
 Provides serialization and deserialization methods for HakkaJson types.
 """
 
-from typing import IO
+import io
+import mmap
+import os
+import re
+from contextlib import suppress
+from typing import IO, Callable, Dict, Final, Optional, Set, Union
 from ._hakka_json_base import HakkaJsonBase
 from ._hakka_json_array import HakkaJsonArray
 from ._hakka_json_object import HakkaJsonObject
 
+JsonInput = Union[str, bytes, bytearray, memoryview]
+
+# Maps the first significant character of a JSON document to its loader.
+# Byte inputs index to ints, so the opening brackets are listed both ways.
+_LOADS_DISPATCH: Final[Dict[Union[str, int], Callable[..., HakkaJsonBase]]] = {
+    "[": HakkaJsonArray.loads,
+    "{": HakkaJsonObject.loads,
+    0x5B: HakkaJsonArray.loads,
+    0x7B: HakkaJsonObject.loads,
+}
+_LEADING_WHITESPACE: Final = re.compile(r"[ \t\n\r]*")
+_LEADING_WHITESPACE_BYTES: Final = re.compile(rb"[ \t\n\r]*")
+_RAW_IO_BUFFER_SIZE: Final = 1 << 20
+# Below this size a plain read() is cheaper than setting up a mapping.
+_MMAP_MIN_SIZE: Final = 1 << 16
+# Concrete classes already known to pass the HakkaJsonBase check.
+_VALIDATED: Final[Set[type]] = set()
+
+
+def _check_serializable(obj: HakkaJsonBase) -> None:
+    cls = type(obj)
+    if cls not in _VALIDATED:
+        if not isinstance(obj, HakkaJsonBase):
+            raise TypeError("obj must be an instance of HakkaJsonBase")
+        _VALIDATED.add(cls)
+
+
+class _RawWriteThrough(io.RawIOBase):
+    """
+    Raw stream that forwards writes to a caller's raw file.
+
+    dump() buffers through this rather than the file itself, so the
+    BufferedWriter never owns, and so never closes, the caller's file, and
+    output still buffered when serialization fails can be dropped.
+    """
+
+    def __init__(self, raw: io.RawIOBase):
+        super().__init__()
+        self._raw = raw
+        self.discard = False
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> Optional[int]:
+        if self.discard:
+            return len(data)
+        return self._raw.write(data)
+
+
+def _loads_impl(string: JsonInput, max_depth: int) -> HakkaJsonBase:
+    """
+    Parse a JSON document with the loader matching its first significant character.
+
+    Anything that is neither an array nor an object is handed to
+    HakkaJsonObject.loads, which reports it as invalid JSON.
+
+    Raises:
+        ValueError: If the input is empty or not valid JSON.
+    """
+    if not string:
+        raise ValueError("JSON input must not be empty")
+    loads = _LOADS_DISPATCH.get(string[0])
+    if loads is None:
+        whitespace = (
+            _LEADING_WHITESPACE
+            if isinstance(string, str)
+            else _LEADING_WHITESPACE_BYTES
+        )
+        start = whitespace.match(string).end()
+        if start < len(string):
+            loads = _LOADS_DISPATCH.get(string[start])
+    return (loads or HakkaJsonObject.loads)(string, max_depth)
+
+
+def _load_mapped(file: IO, max_depth: int) -> Optional[HakkaJsonBase]:
+    """
+    Parse the rest of a seekable binary file through a copy-on-write mmap.
+
+    The mapping is private and writable so the loaders can hand its pages to C
+    in place; nothing writes to it, so no page is ever copied.
+
+    Returns None when the file cannot be mapped (text mode, pipes, sockets,
+    small or empty files), in which case the caller falls back to read().
+    """
+    if not isinstance(file, (io.RawIOBase, io.BufferedIOBase)):
+        return None
+    try:
+        file.flush()
+        fd = file.fileno()
+        offset = file.tell()
+        size = os.fstat(fd).st_size
+    except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+        return None
+    if size - offset < _MMAP_MIN_SIZE:
+        return None
+    try:
+        mapped = mmap.mmap(fd, size, access=mmap.ACCESS_COPY)
+    except (OSError, ValueError):
+        return None
+    try:
+        # No context manager on the views: the loaders may wrap them in a
+        # ctypes array, which keeps them exported until it is collected.
+        result = _loads_impl(memoryview(mapped)[offset:], max_depth)
+        file.seek(size)
+        return result
+    finally:
+        # A traceback may still reference the view; the mapping is then
+        # released by the garbage collector instead.
+        with suppress(BufferError):
+            mapped.close()
+
 
 class HakkaJson:
     """
@@ -20,22 +137,45 @@ class HakkaJson:
     """
 
     @staticmethod
-    def dump(obj: HakkaJsonBase, file: IO, max_depth: int = 512):
+    def dump(obj: HakkaJsonBase, file: IO, max_depth: int = 512) -> int:
         """
         Serialize a HakkaJsonBase object and write it to a file.
 
+        The output is written in chunks rather than as one large string.
+        Binary files receive UTF-8 bytes; anything else receives ``str``.
+        Unbuffered (raw) files are wrapped in a BufferedWriter for the call.
+
         Args:
             obj (HakkaJsonBase): The object to serialize.
             file (IO): A writable file-like object.
             max_depth (int, optional): Maximum recursion depth for serialization.
 
+        Returns:
+            int: The number of bytes (binary files) or characters written.
+
         Raises:
             TypeError: If obj is not an instance of HakkaJsonBase.
             RuntimeError: If serialization fails.
         """
-        if not issubclass(type(obj), HakkaJsonBase):
-            raise TypeError("obj must be an instance of HakkaJsonBase")
-        return file.write(obj.dumps(max_depth))
+        _check_serializable(obj)
+        if isinstance(file, io.RawIOBase):
+            # Raw writes may be short and cost a syscall each; let a
+            # BufferedWriter coalesce the chunks and retry partial writes.
+            sink = _RawWriteThrough(file)
+            writer = io.BufferedWriter(sink, _RAW_IO_BUFFER_SIZE)
+            try:
+                written = obj.dump_to(writer.write, max_depth, binary=True)
+                writer.flush()
+            except BaseException:
+                # detach() flushes too; keep it from writing partial JSON or
+                # raising over the original error.
+                sink.discard = True
+                raise
+            finally:
+                writer.detach()
+            return written
+        binary = isinstance(file, io.BufferedIOBase)
+        return obj.dump_to(file.write, max_depth, binary=binary)
 
     @staticmethod
     def dumps(obj: HakkaJsonBase, max_depth: int = 512) -> str:
@@ -53,8 +193,7 @@ class HakkaJson:
             TypeError: If obj is not an instance of HakkaJsonBase.
             RuntimeError: If serialization fails.
         """
-        if not issubclass(type(obj), HakkaJsonBase):
-            raise TypeError("obj must be an instance of HakkaJsonBase")
+        _check_serializable(obj)
         return obj.dumps(max_depth)
 
     @staticmethod
@@ -63,46 +202,45 @@ class HakkaJson:
         Deserialize a HakkaJsonBase object from a file.
 
         Args:
-            file (IO): A readable file-like object.
+            file (IO): A readable file-like object, opened in text or binary mode.
+                Binary files skip the Python-side UTF-8 decode; large seekable
+                ones are memory-mapped instead of read, and unbuffered (raw)
+                files are read through a BufferedReader.
 
         Returns:
             HakkaJsonBase: The deserialized object.
 
         Raises:
+            ValueError: If the file is empty or not valid JSON.
             RuntimeError: If deserialization fails.
         """
-        # io to string and pass to HakkaJsonArray
-        string = file.read()
-        if string == "":
-            raise ValueError("file must not be empty")
-        # breakpoint()
-        return (
-            HakkaJsonArray.loads(string, max_depth)
-            if string[0] == "["
-            else HakkaJsonObject.loads(string, max_depth)
-        )
+        result = _load_mapped(file, max_depth)
+        if result is not None:
+            return result
+        if isinstance(file, io.RawIOBase):
+            reader = io.BufferedReader(file, _RAW_IO_BUFFER_SIZE)
+            try:
+                string = reader.read()
+            finally:
+                reader.detach()
+        else:
+            string = file.read()
+        return _loads_impl(string, max_depth)
 
     @staticmethod
-    def loads(string: str, max_depth: int = 512) -> HakkaJsonBase:
+    def loads(string: JsonInput, max_depth: int = 512) -> HakkaJsonBase:
         """
         Deserialize a HakkaJsonBase object from a JSON string.
 
         Args:
-            string (str): The JSON string.
+            string (str | bytes | bytearray | memoryview): The JSON string, or
+                its UTF-8 encoded bytes.
 
         Returns:
             HakkaJsonBase: The deserialized object.
 
         Raises:
+            ValueError: If the string is empty or not valid JSON.
             RuntimeError: If deserialization fails.
         """
-        if string == "":
-            raise ValueError("string must not be empty")
-        return (
-            HakkaJsonArray.loads(string, max_depth)
-            if string[0] == "["
-            else HakkaJsonObject.loads(
-                string,
-                max_depth,
-            )
-        )
+        return _loads_impl(string, max_depth)
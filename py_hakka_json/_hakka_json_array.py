@@ -4,13 +4,24 @@ Represents a JSON array value in HakkaJson.
 Implements list-like behavior.
 """
 
-from ctypes import byref, c_int32, c_uint32, c_uint8, c_uint64
-from typing import Any, Optional, Union
-
-from ._hakka_json_base import HakkaJsonBase
-from ._hakka_json_loader import CHakkaHandle, CHakkaArrayIter, dispatch_table
-from ._hakka_json_enum import HakkaJsonResultEnum, HakkaJsonTypeEnum
-from ._hakka_json_type_dispatcher import obj_from_python, handle_to_object
+import threading
+from functools import lru_cache
+from ctypes import byref, c_double, c_int32, c_int64, c_uint32, c_uint8, c_uint64
+from typing import Any, Iterator, Optional, Union
+
+from ._hakka_json_base import BufferAllocator, HakkaJsonBase, json_input_buffer
+from ._hakka_json_loader import CHakkaHandle, dispatch_table
+from ._hakka_json_enum import HakkaJsonResultEnum, HakkaJsonTypeEnum, result_name
+from ._hakka_json_type_dispatcher import (
+    obj_from_python,
+    handle_to_object,
+    handle_to_typed_object,
+)
+from ._hakka_json_null import HakkaJsonNull
+from ._hakka_json_bool import HakkaJsonBool
+from ._hakka_json_int import HakkaJsonInt
+from ._hakka_json_float import HakkaJsonFloat
+from ._hakka_json_string import HakkaJsonString
 
 __all__ = ["HakkaJsonArray", "HakkaJsonArrayIterator"]
 
@@ -40,12 +51,127 @@ _pop_array_func = dispatch_table["PopHakkaArray"]
 _remove_value_array_func = dispatch_table["RemoveValueHakkaArray"]
 _reverse_array_func = dispatch_table["ReverseHakkaArray"]
 
-# Iterators
-_create_array_iter_begin_func = dispatch_table["CreateHakkaArrayIterBegin"]
-_create_array_iter_rbegin_func = dispatch_table["CreateHakkaArrayIterRBegin"]
-_move_array_iter_next_func = dispatch_table["MoveHakkaArrayIterNext"]
-_get_array_iter_deref_func = dispatch_table["GetHakkaArrayIterDeref"]
-_release_array_iter_func = dispatch_table["HakkaArrayIterRelease"]
+# Scalar accessors for the to_python fast path
+_hakka_type_func = dispatch_table["HakkaType"]
+_hakka_release_func = dispatch_table["HakkaRelease"]
+_get_int_func = dispatch_table["GetHakkaInt"]
+_get_float_func = dispatch_table["GetHakkaFloat"]
+
+
+class _Scratch(threading.local):
+    """
+    Per-thread out-parameters for C calls whose result is read back right away.
+
+    Handles are not pooled here: a CHakkaHandle passed to handle_to_object is
+    adopted by the returned object and must stay unique.
+    """
+
+    def __init__(self):
+        self.u32 = c_uint32()
+        self.u32_ref = byref(self.u32)
+        self.u64 = c_uint64()
+        self.u64_ref = byref(self.u64)
+        self.i64 = c_int64()
+        self.i64_ref = byref(self.i64)
+        self.f64 = c_double()
+        self.f64_ref = byref(self.f64)
+        # A one-element array passes as a pointer without any byref wrapper
+        # and is read back by index; used by the hot __len__ path.
+        self.size = (c_uint32 * 1)()
+
+
+_scratch = _Scratch()
+
+# Operator codes for _compare.
+_OP_EQ, _OP_NE, _OP_LT, _OP_LE, _OP_GT, _OP_GE = range(6)
+
+# Largest index the C API can take (it is passed as uint32_t). Indices in
+# [0, _MAX_INDEX] go straight to C, which reports HAKKA_JSON_INDEX_OUT_OF_BOUNDS;
+# anything else needs the array size first.
+_MAX_INDEX = 0xFFFFFFFF
+
+# Raw result codes returned by the array bindings (restype c_int).
+_TYPE_ERROR = HakkaJsonResultEnum.HAKKA_JSON_TYPE_ERROR.value
+_KEY_NOT_FOUND = HakkaJsonResultEnum.HAKKA_JSON_KEY_NOT_FOUND.value
+_INDEX_OUT_OF_BOUNDS = HakkaJsonResultEnum.HAKKA_JSON_INDEX_OUT_OF_BOUNDS.value
+_INT_TYPE = HakkaJsonTypeEnum.HAKKA_JSON_INT.value
+_FLOAT_TYPE = HakkaJsonTypeEnum.HAKKA_JSON_FLOAT.value
+
+# Parse failures from LoadsHakkaArray that map to a specific Python exception.
+_LOAD_ERRORS = {
+    HakkaJsonResultEnum.HAKKA_JSON_RECURSION_DEPTH_EXCEEDED.value: (
+        RecursionError,
+        "Recursion depth exceeded in HakkaJsonArray.",
+    ),
+    HakkaJsonResultEnum.HAKKA_JSON_PARSE_ERROR.value: (
+        ValueError,
+        "Invalid JSON string for HakkaJsonArray.",
+    ),
+}
+
+
+# Exact-type constructors for the common element types; anything else
+# (containers, subclasses) goes through obj_from_python.
+_CONVERTERS = {
+    type(None): lambda _: HakkaJsonNull(),
+    bool: HakkaJsonBool,
+    int: HakkaJsonInt,
+    float: HakkaJsonFloat,
+    str: HakkaJsonString,
+}
+
+
+def _to_hakka(value: Any) -> HakkaJsonBase:
+    """Convert a Python value to a Hakka object, passing Hakka objects through."""
+    convert = _CONVERTERS.get(type(value))
+    if convert is not None:
+        return convert(value)
+    if isinstance(value, HakkaJsonBase):
+        return value
+    return obj_from_python(value)
+
+
+# Scalar types whose Hakka conversion can be shared between lookups. Strings
+# are cached only up to _PROBE_CACHE_MAX_STR characters, so the cache never
+# pins large native buffers.
+_PROBE_CACHE_TYPES = frozenset((int, float, bool))
+_PROBE_CACHE_MAX_STR = 64
+
+
+@lru_cache(maxsize=128, typed=True)
+def _cached_probe(value):
+    return _CONVERTERS[type(value)](value)
+
+
+def _as_probe(value: Any) -> HakkaJsonBase:
+    """
+    Convert a lookup argument (for in/count/index/remove) to a Hakka object.
+
+    Conversions of repeated numbers, bools and short strings are cached; the
+    result is only compared against, never stored, so sharing it is safe.
+    """
+    if isinstance(value, HakkaJsonBase):
+        return value
+    value_type = type(value)
+    if value_type in _PROBE_CACHE_TYPES or (
+        value_type is str and len(value) <= _PROBE_CACHE_MAX_STR
+    ):
+        return _cached_probe(value)
+    return obj_from_python(value)
+
+
+_EMPTY_ARRAY = None
+
+
+def _empty_array() -> "HakkaJsonArray":
+    """
+    Shared empty array used as the source when a slice is deleted or cleared.
+    SetHakkaArraySlice only reads from its source, so one instance serves all.
+    """
+    global _EMPTY_ARRAY  # pylint: disable=global-statement
+    if _EMPTY_ARRAY is None:
+        _EMPTY_ARRAY = HakkaJsonArray()
+    return _EMPTY_ARRAY
 
 
 class HakkaJsonArray(HakkaJsonBase):
@@ -69,11 +195,8 @@ class HakkaJsonArray(HakkaJsonBase):
         elif isinstance(
             initial, (list, tuple)
         ):  # construct from other, so this is a new one
-            new_array = HakkaJsonArray()
-            for item in initial:
-                new_array.append(item)
-            self._c_hakka_handle = new_array._c_hakka_handle
-            new_array._c_hakka_handle = None
+            self._c_hakka_handle = self._construct()
+            self._push_items(initial)
         else:
             raise TypeError("Unsupported type for HakkaJsonArray initialization.")
         super().__init__(self._c_hakka_handle)
@@ -81,42 +204,41 @@ class HakkaJsonArray(HakkaJsonBase):
     @staticmethod
     def _construct() -> CHakkaHandle:
         c_hakka_handle = CHakkaHandle()
-        result = _create_array_func(byref(c_hakka_handle))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to create HakkaJsonArray: {result.name}.")
+        result = _create_array_func(c_hakka_handle)
+        if result:
+            raise RuntimeError(
+                f"Failed to create HakkaJsonArray: {result_name(result)}."
+            )
         return c_hakka_handle
 
     @staticmethod
-    def loads(json_str: str, max_depth: int = 512) -> "HakkaJsonArray":
+    def loads(
+        json_str: Union[str, bytes, bytearray, memoryview], max_depth: int = 512
+    ) -> "HakkaJsonArray":
         """
         Create a HakkaJsonArray object from a JSON string.
 
         Args:
-            json_str (str): The JSON string.
+            json_str (str | bytes | bytearray | memoryview): The JSON string, or
+                its UTF-8 encoded bytes.
 
         Returns:
             HakkaJsonArray: The HakkaJsonArray object.
         """
-        json_str = json_str.encode("utf-8")
-        json_str += b"\x00"
-        buffer_size = c_uint32(len(json_str))
-        buffer = (c_uint8 * buffer_size.value).from_buffer_copy(json_str)
+        json_buffer = json_input_buffer(json_str)
         c_hakka_handle = CHakkaHandle()
         result = _loads_array_func(
-            buffer,
-            buffer_size,
-            byref(c_hakka_handle),
-            c_uint32(max_depth),
+            json_buffer,
+            len(json_buffer),
+            c_hakka_handle,
+            max_depth,
         )
-        match result:
-            case HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-                return HakkaJsonArray(HakkaJsonBase(c_hakka_handle))
-            case HakkaJsonResultEnum.HAKKA_JSON_RECURSION_DEPTH_EXCEEDED:
-                raise RecursionError("Recursion depth exceeded in HakkaJsonArray.")
-            case HakkaJsonResultEnum.HAKKA_JSON_PARSE_ERROR:
-                raise ValueError("Invalid JSON string for HakkaJsonArray.")
-            case _:
-                raise RuntimeError(f"Failed to load HakkaJsonArray: {result.name}.")
+        if result:
+            error, message = _LOAD_ERRORS.get(
+                result,
+                (RuntimeError, f"Failed to load HakkaJsonArray: {result_name(result)}."),
+            )
+            raise error(message)
         return HakkaJsonArray(HakkaJsonBase(c_hakka_handle))
 
     def to_python(self) -> list:
@@ -126,27 +248,26 @@ class HakkaJsonArray(HakkaJsonBase):
         Returns:
             list: The list representation.
         """
-        import sys
-        # Increase recursion limit temporarily for deeply nested structures
-        old_limit = sys.getrecursionlimit()
-        try:
-            # Set a higher limit if needed (but not too high to avoid stack overflow)
-            if old_limit < 2000:
-                sys.setrecursionlimit(2000)
-
-            result = []
-            for item in self:
-                # Recursively convert each item to Python
-                # Check if it's a Hakka type with to_python method
-                if hasattr(item, 'to_python') and callable(getattr(item, 'to_python')):
-                    result.append(item.to_python())
+        # Nested arrays are walked with an explicit stack of (output list,
+        # element generator) pairs, so array depth costs no Python frames.
+        result = []
+        stack = [(result, self._iter_python_items())]
+        while stack:
+            out, items = stack[-1]
+            for item in items:
+                if isinstance(item, HakkaJsonArray):
+                    child = []
+                    out.append(child)
+                    stack.append((child, item._iter_python_items()))
+                    break
+                if hasattr(item, "to_python") and callable(getattr(item, "to_python")):
+                    out.append(item.to_python())
                 else:
                     # Already a Python primitive
-                    result.append(item)
-            return result
-        finally:
-            # Restore original recursion limit
-            sys.setrecursionlimit(old_limit)
+                    out.append(item)
+            else:
+                stack.pop()
+        return result
 
     @staticmethod
     def from_python(py_list: Union[list, tuple]) -> "HakkaJsonArray":
@@ -166,33 +287,41 @@ class HakkaJsonArray(HakkaJsonBase):
             raise TypeError("from_python expects a list or tuple.")
         return HakkaJsonArray(py_list)
 
-    def dumps(self, max_depth: int = 512) -> str:
+    def _dump_buffer(
+        self, max_depth: int, allocate: Optional[BufferAllocator] = None
+    ) -> memoryview:
         """
-        Serialize the HakkaJsonArray to a JSON string.
+        Serialize the HakkaJsonArray into a C buffer.
 
         Args:
-            max_depth (int, optional): Maximum recursion depth.
+            max_depth (int): Maximum recursion depth.
+            allocate (Callable, optional): Returns a writable c_uint8 array of
+                at least the given size. Defaults to a fresh zeroed array.
 
         Returns:
-            str: The JSON string representation.
+            memoryview: A byte view over the UTF-8 encoded JSON text.
 
         Raises:
             RuntimeError: If dumping fails.
         """
-        buffer_size = c_uint64()
+        scratch = _scratch
         # First call to get required buffer size
-        result = _dump_size_array_func(self._c_hakka_handle, byref(buffer_size))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to get size of HakkaJsonArray: {result.name}.")
+        result = _dump_size_array_func(self._c_hakka_handle, scratch.u64_ref)
+        if result:
+            raise RuntimeError(
+                f"Failed to get size of HakkaJsonArray: {result_name(result)}."
+            )
 
         # Allocate buffer with the required size
-        buffer = (c_uint8 * buffer_size.value)()
+        size = scratch.u64.value
+        buffer = allocate(size) if allocate is not None else (c_uint8 * size)()
         result = _dump_array_func(
-            self._c_hakka_handle, c_uint32(max_depth), buffer, byref(buffer_size)
+            self._c_hakka_handle, max_depth, buffer, scratch.u64_ref
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to dump HakkaJsonArray: {result.name}.")
-        return bytes(buffer[: buffer_size.value]).decode("utf-8")
+        size = scratch.u64.value
+        if result:
+            raise RuntimeError(f"Failed to dump HakkaJsonArray: {result_name(result)}.")
+        return memoryview(buffer).cast("B")[:size]
 
     def __bool__(self) -> bool:
         """
@@ -213,11 +342,13 @@ class HakkaJsonArray(HakkaJsonBase):
         Raises:
             RuntimeError: If the C API call fails.
         """
-        size = c_uint32()
-        result = _get_array_size_func(self._c_hakka_handle, byref(size))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to get size of HakkaJsonArray: {result.name}.")
-        return size.value
+        size = _scratch.size
+        result = _get_array_size_func(self._c_hakka_handle, size)
+        if result:
+            raise RuntimeError(
+                f"Failed to get size of HakkaJsonArray: {result_name(result)}."
+            )
+        return size[0]
 
     def __getitem__(self, index: Union[int, slice]) -> Union[Any, "HakkaJsonArray"]:
         """
@@ -262,45 +393,111 @@ class HakkaJsonArray(HakkaJsonBase):
             raise TypeError("Index must be an integer or slice.")
 
     def _get_item(self, index: int) -> Any:
-        size = len(self)
-        if index < 0:
-            index += size
-        if not (0 <= index < size):
-            raise IndexError("HakkaJsonArray index out of range.")
+        if not 0 <= index <= _MAX_INDEX:
+            size = len(self)
+            if index < 0:
+                index += size
+            if not (0 <= index < size):
+                raise IndexError("HakkaJsonArray index out of range.")
 
         item_handle = CHakkaHandle()
-        res = _get_array_object_func(self._c_hakka_handle, index, byref(item_handle))
-        if res != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to get item at index {index}: {res.name}.")
+        res = _get_array_object_func(self._c_hakka_handle, index, item_handle)
+        if res == _INDEX_OUT_OF_BOUNDS:
+            raise IndexError("HakkaJsonArray index out of range.")
+        elif res:
+            raise RuntimeError(
+                f"Failed to get item at index {index}: {result_name(res)}."
+            )
         return handle_to_object(item_handle)
 
+    def _iter_items(self) -> Iterator[Any]:
+        """
+        Yield every element, querying the size once up front.
+
+        Internal whole-array walks use this; unlike __iter__, they expect the
+        array not to change size while walking it.
+        """
+        handle = self._c_hakka_handle
+        get_item = _get_array_object_func
+        for index in range(len(self)):
+            item_handle = CHakkaHandle()
+            result = get_item(handle, index, item_handle)
+            if result:
+                raise RuntimeError(
+                    f"Failed to get item at index {index}: {result_name(result)}."
+                )
+            yield handle_to_object(item_handle)
+
+    def _iter_python_items(self) -> Iterator[Any]:
+        """
+        Like _iter_items, but yield ints and floats as Python values.
+
+        Numbers are read straight from the element handle, skipping the
+        HakkaJsonInt/HakkaJsonFloat wrapper, which copies the value into a new
+        C value on construction. Everything else is yielded as a Hakka object.
+        """
+        handle = self._c_hakka_handle
+        scratch = _scratch
+        for index in range(len(self)):
+            item_handle = CHakkaHandle()
+            result = _get_array_object_func(handle, index, item_handle)
+            if result:
+                raise RuntimeError(
+                    f"Failed to get item at index {index}: {result_name(result)}."
+                )
+            result = _hakka_type_func(item_handle, scratch.u32_ref)
+            if result:
+                _hakka_release_func(item_handle)
+                raise RuntimeError(
+                    f"Failed to get type of item at index {index}: "
+                    f"{result_name(result)}."
+                )
+            type_id = scratch.u32.value
+            if type_id not in (_INT_TYPE, _FLOAT_TYPE):
+                yield handle_to_typed_object(item_handle, type_id)
+                continue
+            if type_id == _INT_TYPE:
+                result = _get_int_func(item_handle, scratch.i64_ref)
+                value = scratch.i64.value
+            else:
+                result = _get_float_func(item_handle, scratch.f64_ref)
+                value = scratch.f64.value
+            _hakka_release_func(item_handle)
+            if result:
+                raise RuntimeError(
+                    f"Failed to read number at index {index}: {result_name(result)}."
+                )
+            yield value
+
     def _get_slice(self, index: slice) -> "HakkaJsonArray":
         start, stop, step = index.indices(len(self))
         new_array_handle = CHakkaHandle()
         result = _get_array_slice_func(
-            self._c_hakka_handle, start, stop, step, byref(new_array_handle)
+            self._c_hakka_handle, start, stop, step, new_array_handle
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        if result:
             raise RuntimeError(
-                f"Failed to get slice from HakkaJsonArray {result.name}."
+                f"Failed to get slice from HakkaJsonArray {result_name(result)}."
             )
         return handle_to_object(new_array_handle)
 
     def _set_item(self, index: int, value: Any):
-        size = len(self)
-        if index < 0:
-            index += size
-        if not (0 <= index < size):
-            raise IndexError("HakkaJsonArray assignment index out of range.")
-
-        if not issubclass(type(value), HakkaJsonBase):
-            value = obj_from_python(value)
+        if not 0 <= index <= _MAX_INDEX:
+            size = len(self)
+            if index < 0:
+                index += size
+            if not (0 <= index < size):
+                raise IndexError("HakkaJsonArray assignment index out of range.")
+
+        value = _to_hakka(value)
         result = _set_array_func(
             self._c_hakka_handle,
             index,
             value._c_hakka_handle,  # pylint: disable=protected-access
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        if result == _INDEX_OUT_OF_BOUNDS:
+            raise IndexError("HakkaJsonArray assignment index out of range.")
+        elif result:
             raise RuntimeError(f"Failed to set item at index {index}.")
 
     def _set_slice(self, index: slice, value: Any):
@@ -308,12 +505,14 @@ class HakkaJsonArray(HakkaJsonBase):
             raise TypeError("Can only assign an iterable to a slice.")
         start, stop, step = index.indices(len(self))
         if isinstance(value, (list, tuple)):
-            value = HakkaJsonArray(value)
+            value = HakkaJsonArray(value) if value else _empty_array()
         result = _set_array_slice_func(
             self._c_hakka_handle, start, stop, step, value._c_hakka_handle
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to set slice in HakkaJsonArray {result.value}.")
+        if result:
+            raise RuntimeError(
+                f"Failed to set slice in HakkaJsonArray {result_name(result)}."
+            )
 
     def __delitem__(self, index: Union[int, slice]):
         """
@@ -328,23 +527,26 @@ class HakkaJsonArray(HakkaJsonBase):
             RuntimeError: If the C API call fails.
         """
         if isinstance(index, slice):
-            self.__setitem__(index, [])
+            self._set_slice(index, ())
         elif isinstance(index, int):
             self._remove_item(index)
         else:
             raise TypeError("Index must be an integer or slice.")
 
     def _remove_item(self, index: int):
-        size = len(self)
-        if index < 0:
-            index += size
-        if not (0 <= index < size):
-            raise IndexError("HakkaJsonArray deletion index out of range.")
+        if not 0 <= index <= _MAX_INDEX:
+            size = len(self)
+            if index < 0:
+                index += size
+            if not (0 <= index < size):
+                raise IndexError("HakkaJsonArray deletion index out of range.")
 
         result = _remove_array_index_func(self._c_hakka_handle, index)
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        if result == _INDEX_OUT_OF_BOUNDS:
+            raise IndexError("HakkaJsonArray deletion index out of range.")
+        elif result:
             raise RuntimeError(
-                f"Failed to delete item at index {index}: {result.name}."
+                f"Failed to delete item at index {index}: {result_name(result)}."
             )
 
     def __contains__(self, item: Any) -> bool:
@@ -357,11 +559,21 @@ class HakkaJsonArray(HakkaJsonBase):
         Returns:
             bool: True if the item is in the array, False otherwise.
         """
-        try:
-            self.index(item)
-            return True
-        except ValueError:
+        scratch = _scratch
+        result = _find_first_array_func(
+            self._c_hakka_handle,
+            _as_probe(item)._c_hakka_handle,
+            0,
+            len(self),
+            scratch.u32_ref,
+        )
+        if result == _KEY_NOT_FOUND:
             return False
+        elif result:
+            raise RuntimeError(
+                f"Value not found in HakkaJsonArray: {result_name(result)}."
+            )
+        return True
 
     def append(self, value: Any):
         """
@@ -373,12 +585,27 @@ class HakkaJsonArray(HakkaJsonBase):
         Raises:
             RuntimeError: If the C API call fails.
         """
-        value_obj = (
-            obj_from_python(value) if not isinstance(value, HakkaJsonBase) else value
-        )
+        value_obj = _to_hakka(value)
         result = _push_back_array_func(self._c_hakka_handle, value_obj._c_hakka_handle)
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to append to HakkaJsonArray: {result.name}.")
+        if result:
+            raise RuntimeError(
+                f"Failed to append to HakkaJsonArray: {result_name(result)}."
+            )
+
+    def _push_items(self, items: Union[list, tuple]):
+        """
+        Append every item of a list or tuple, with the converter and the C
+        push-back bound once for the whole batch instead of going through append.
+        """
+        handle = self._c_hakka_handle
+        push_back = _push_back_array_func
+        to_hakka = _to_hakka
+        for item in items:
+            result = push_back(handle, to_hakka(item)._c_hakka_handle)
+            if result:
+                raise RuntimeError(
+                    f"Failed to append to HakkaJsonArray: {result_name(result)}."
+                )
 
     def extend(self, iterable: Union["HakkaJsonArray", list, tuple]):
         """
@@ -392,14 +619,17 @@ class HakkaJsonArray(HakkaJsonBase):
             RuntimeError: If the C API call fails.
         """
         if isinstance(iterable, (list, tuple)):
-            iterable = HakkaJsonArray(iterable)
+            self._push_items(iterable)
+            return
         elif not isinstance(iterable, HakkaJsonArray):
             raise TypeError(
                 "extend expects a HakkaJsonArray or iterable of HakkaJsonBase."
             )
         result = _extend_array_func(self._c_hakka_handle, iterable._c_hakka_handle)
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to extend HakkaJsonArray: {result.name}.")
+        if result:
+            raise RuntimeError(
+                f"Failed to extend HakkaJsonArray: {result_name(result)}."
+            )
 
     def insert(self, index: int, value: Any):
         """
@@ -414,16 +644,16 @@ class HakkaJsonArray(HakkaJsonBase):
             IndexError: If index is out of bounds.
             RuntimeError: If the C API call fails.
         """
-        value_obj = (
-            obj_from_python(value) if not isinstance(value, HakkaJsonBase) else value
-        )
+        value_obj = _to_hakka(value)
         result = _insert_array_func(
             self._c_hakka_handle, index, value_obj._c_hakka_handle
         )
-        if result == HakkaJsonResultEnum.HAKKA_JSON_INDEX_OUT_OF_BOUNDS:
+        if result == _INDEX_OUT_OF_BOUNDS:
             raise IndexError("Index out of bounds for HakkaJsonArray.")
-        elif result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to insert at index {index}: {result.name}.")
+        elif result:
+            raise RuntimeError(
+                f"Failed to insert at index {index}: {result_name(result)}."
+            )
 
     def remove(self, value: Any):
         """
@@ -437,19 +667,17 @@ class HakkaJsonArray(HakkaJsonBase):
             TypeError: If value type is unsupported.
             RuntimeError: If the C API call fails.
         """
-        value_obj = (
-            obj_from_python(value) if not isinstance(value, HakkaJsonBase) else value
-        )
+        value_obj = _as_probe(value)
         result = _remove_value_array_func(
             self._c_hakka_handle, value_obj._c_hakka_handle
         )
-        if result == HakkaJsonResultEnum.HAKKA_JSON_KEY_NOT_FOUND:
+        if result == _KEY_NOT_FOUND:
             raise ValueError("Value not found in HakkaJsonArray.")
-        elif result == HakkaJsonResultEnum.HAKKA_JSON_TYPE_ERROR:
+        elif result == _TYPE_ERROR:
             raise TypeError(f"Type error in HakkaJsonArray: {value}.")
-        elif result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        elif result:
             raise RuntimeError(
-                f"Failed to remove value from HakkaJsonArray: {result.name}."
+                f"Failed to remove value from HakkaJsonArray: {result_name(result)}."
             )
 
     def pop(self, index: int = -1) -> Any:
@@ -466,18 +694,23 @@ class HakkaJsonArray(HakkaJsonBase):
             IndexError: If the array is empty or index is out of range.
             RuntimeError: If the C API call fails.
         """
-        size = len(self)
-        if size == 0:
-            raise IndexError("pop from empty HakkaJsonArray.")
-        if index < 0:
-            index += size
-        if not (0 <= index < size):
-            raise IndexError("pop index out of range.")
+        if not 0 <= index <= _MAX_INDEX:
+            size = len(self)
+            if size == 0:
+                raise IndexError("pop from empty HakkaJsonArray.")
+            if index < 0:
+                index += size
+            if not (0 <= index < size):
+                raise IndexError("pop index out of range.")
 
         popped_handle = CHakkaHandle()
-        result = _pop_array_func(self._c_hakka_handle, index, byref(popped_handle))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to pop item at index {index}: {result.name}.")
+        result = _pop_array_func(self._c_hakka_handle, index, popped_handle)
+        if result == _INDEX_OUT_OF_BOUNDS:
+            raise IndexError("pop index out of range.")
+        elif result:
+            raise RuntimeError(
+                f"Failed to pop item at index {index}: {result_name(result)}."
+            )
         return handle_to_object(popped_handle)
 
     def clear(self):
@@ -488,8 +721,10 @@ class HakkaJsonArray(HakkaJsonBase):
             RuntimeError: If the C API call fails.
         """
         result = _clear_array_func(self._c_hakka_handle)
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to clear HakkaJsonArray: {result.name}.")
+        if result:
+            raise RuntimeError(
+                f"Failed to clear HakkaJsonArray: {result_name(result)}."
+            )
 
     def count(self, value: Any) -> int:
         """
@@ -504,20 +739,16 @@ class HakkaJsonArray(HakkaJsonBase):
         Raises:
             RuntimeError: If the C API call fails.
         """
-        value_obj = (
-            obj_from_python(value)
-            if not issubclass(type(value), HakkaJsonBase)
-            else value
-        )
-        count = c_uint32()
+        value_obj = _as_probe(value)
+        scratch = _scratch
         result = _count_array_func(
-            self._c_hakka_handle, value_obj._c_hakka_handle, byref(count)
+            self._c_hakka_handle, value_obj._c_hakka_handle, scratch.u32_ref
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        if result:
             raise RuntimeError(
-                f"Failed to count occurrences in HakkaJsonArray: {result.name}."
+                f"Failed to count occurrences in HakkaJsonArray: {result_name(result)}."
             )
-        return count.value
+        return scratch.u32.value
 
     def index(self, value: Any, start: int = 0, stop: Optional[int] = None) -> int:
         """
@@ -536,24 +767,24 @@ class HakkaJsonArray(HakkaJsonBase):
             TypeError: If value type is unsupported.
             RuntimeError: If the C API call fails.
         """
-        value_obj = (
-            obj_from_python(value) if not isinstance(value, HakkaJsonBase) else value
-        )
+        value_obj = _as_probe(value)
         stop = stop if stop is not None else len(self)
 
-        index = c_uint32()
+        scratch = _scratch
         result = _find_first_array_func(
             self._c_hakka_handle,
             value_obj._c_hakka_handle,
             start,
             stop,
-            byref(index),
+            scratch.u32_ref,
         )
-        if result == HakkaJsonResultEnum.HAKKA_JSON_KEY_NOT_FOUND:
+        if result == _KEY_NOT_FOUND:
             raise ValueError("Value not found in HakkaJsonArray.")
-        elif result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Value not found in HakkaJsonArray: {result.name}.")
-        return index.value
+        elif result:
+            raise RuntimeError(
+                f"Value not found in HakkaJsonArray: {result_name(result)}."
+            )
+        return scratch.u32.value
 
     def reverse(self):
         """
@@ -563,8 +794,10 @@ class HakkaJsonArray(HakkaJsonBase):
             RuntimeError: If the C API call fails.
         """
         result = _reverse_array_func(self._c_hakka_handle)
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to reverse HakkaJsonArray: {result.name}.")
+        if result:
+            raise RuntimeError(
+                f"Failed to reverse HakkaJsonArray: {result_name(result)}."
+            )
 
     def copy(self) -> "HakkaJsonArray":
         """
@@ -573,7 +806,12 @@ class HakkaJsonArray(HakkaJsonBase):
         Returns:
             HakkaJsonArray: The shallow copy.
         """
-        return HakkaJsonArray([item for item in self])
+        new_array = HakkaJsonArray()
+        # One native extend copies every element without a Python round trip.
+        result = _extend_array_func(new_array._c_hakka_handle, self._c_hakka_handle)
+        if result:
+            raise RuntimeError(f"Failed to copy HakkaJsonArray: {result_name(result)}.")
+        return new_array
 
     def sort(self, key=None, reverse: bool = False):
         """
@@ -587,10 +825,20 @@ class HakkaJsonArray(HakkaJsonBase):
             RuntimeError: If the C API call fails.
         """
         # Get list of Hakka objects (not converted to Python)
-        items = [item for item in self]
-        items.sort(key=key, reverse=reverse)
-        self.clear()
-        self.extend(items)
+        items = list(self._iter_items())
+        ordered = sorted(items, key=key, reverse=reverse)
+        # Overwrite only the slots whose element moved; the C array keeps its
+        # storage instead of being cleared and grown again.
+        handle = self._c_hakka_handle
+        set_item = _set_array_func
+        for index, (before, after) in enumerate(zip(items, ordered)):
+            if after is before:
+                continue
+            result = set_item(handle, index, after._c_hakka_handle)
+            if result:
+                raise RuntimeError(
+                    f"Failed to sort HakkaJsonArray: {result_name(result)}."
+                )
 
     def __add__(
         self, iterable: Union["HakkaJsonArray", list, tuple]
@@ -609,13 +857,17 @@ class HakkaJsonArray(HakkaJsonBase):
             RuntimeError: If the C API call fails.
         """
         if isinstance(iterable, (list, tuple)):
-            iterable = HakkaJsonArray(iterable)
+            new_array = self.copy()
+            new_array._push_items(iterable)
+            return new_array
         elif not isinstance(iterable, HakkaJsonArray):
             raise TypeError("Can only concatenate HakkaJsonArray with HakkaJsonArray.")
         new_array = self.copy()
         result = _extend_array_func(new_array._c_hakka_handle, iterable._c_hakka_handle)
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to concatenate HakkaJsonArray: {result.name}.")
+        if result:
+            raise RuntimeError(
+                f"Failed to concatenate HakkaJsonArray: {result_name(result)}."
+            )
         return new_array
 
     def __iadd__(self, other: Union["HakkaJsonArray", list, tuple]) -> "HakkaJsonArray":
@@ -654,8 +906,10 @@ class HakkaJsonArray(HakkaJsonBase):
 
         new_array = self.copy()
         result = _multiply_array_func(new_array._c_hakka_handle, times)
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to multiply HakkaJsonArray: {result.name}.")
+        if result:
+            raise RuntimeError(
+                f"Failed to multiply HakkaJsonArray: {result_name(result)}."
+            )
         return new_array
 
     def __rmul__(self, times: int) -> "HakkaJsonArray":
@@ -692,10 +946,25 @@ class HakkaJsonArray(HakkaJsonBase):
             raise TypeError("Can only multiply HakkaJsonArray by an integer.")
 
         result = _multiply_array_func(self._c_hakka_handle, times)
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to multiply HakkaJsonArray: {result.name}.")
+        if result:
+            raise RuntimeError(
+                f"Failed to multiply HakkaJsonArray: {result_name(result)}."
+            )
         return self
 
+    def __iter__(self) -> "HakkaJsonArrayIterator":
+        """
+        Return an iterator over the array.
+
+        Elements are fetched by index straight from the C API, without going
+        through __getitem__. Like list iteration, it stops at the first index
+        past the end, so the array may be resized while it is iterated.
+
+        Returns:
+            HakkaJsonArrayIterator: An iterator over the elements.
+        """
+        return HakkaJsonArrayIterator(self)
+
     def __reversed__(self) -> "HakkaJsonArrayIterator":
         """
         Return a reverse iterator over the array.
@@ -712,9 +981,7 @@ class HakkaJsonArray(HakkaJsonBase):
         Returns:
             str: The string representation.
         """
-        # Show the actual Hakka objects, not their Python conversions
-        items = [repr(item) for item in self]
-        return f"HakkaJsonArray([{', '.join(items)}])"
+        return f"HakkaJsonArray([{self._items_repr()}])"
 
     def __str__(self) -> str:
         """
@@ -723,9 +990,25 @@ class HakkaJsonArray(HakkaJsonBase):
         Returns:
             str: The string representation.
         """
-        # Show the actual Hakka objects, not their Python conversions
-        items = [repr(item) for item in self]
-        return f"[{', '.join(items)}]"
+        return f"[{self._items_repr()}]"
+
+    def _items_repr(self) -> str:
+        """
+        Join the reprs of the actual Hakka objects, not their Python conversions.
+
+        Numbers are formatted the way HakkaJsonInt/HakkaJsonFloat.__repr__ would,
+        without building the wrapper objects.
+        """
+        parts = []
+        for item in self._iter_python_items():
+            kind = type(item)
+            if kind is int:
+                parts.append(f"HakkaJsonInt({item})")
+            elif kind is float:
+                parts.append(f"HakkaJsonFloat({item})")
+            else:
+                parts.append(repr(item))
+        return ", ".join(parts)
 
     def __reduce__(self):
         """
@@ -750,13 +1033,13 @@ class HakkaJsonArray(HakkaJsonBase):
         """
         raise TypeError("unhashable type: 'HakkaJsonArray'")
 
-    def _compare(self, other: Union["HakkaJsonArray", list, tuple], op) -> bool:
+    def _compare(self, other: Union["HakkaJsonArray", list, tuple], op: int) -> bool:
         """
         Compare the array with another HakkaJsonArray.
 
         Args:
             other (HakkaJsonArray, list, or tuple): The other array to compare.
-            op (callable): The comparison operator.
+            op (int): The comparison operator, one of the _OP_* codes.
 
         Returns:
             bool: The result of the comparison.
@@ -765,36 +1048,50 @@ class HakkaJsonArray(HakkaJsonBase):
             TypeError: If other type is unsupported.
             RuntimeError: If the C API call fails.
         """
-        if not isinstance(other, (HakkaJsonArray, list, tuple)):
-            return NotImplemented
-        if not isinstance(other, HakkaJsonArray):
-            other = HakkaJsonArray(other)
+        if type(other) is not HakkaJsonArray:
+            if isinstance(other, (list, tuple)):
+                other = HakkaJsonArray(other)
+            elif not isinstance(other, HakkaJsonArray):
+                return NotImplemented
 
         comparison_result = c_int32()
         result = _compare_func(
-            self._c_hakka_handle, other._c_hakka_handle, byref(comparison_result)
+            self._c_hakka_handle, other._c_hakka_handle, comparison_result
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to compare HakkaJsonArray: {result.name}.")
-        return op(comparison_result.value, 0)
+        if result:
+            raise RuntimeError(
+                f"Failed to compare HakkaJsonArray: {result_name(result)}."
+            )
+        value = comparison_result.value
+        if op == _OP_EQ:
+            return value == 0
+        if op == _OP_NE:
+            return value != 0
+        if op == _OP_LT:
+            return value < 0
+        if op == _OP_LE:
+            return value <= 0
+        if op == _OP_GT:
+            return value > 0
+        return value >= 0
 
     def __eq__(self, other: Any) -> bool:
-        return self._compare(other, lambda x, y: x == y)
+        return self._compare(other, _OP_EQ)
 
     def __ne__(self, other: Any) -> bool:
-        return self._compare(other, lambda x, y: x != y)
+        return self._compare(other, _OP_NE)
 
     def __lt__(self, other: Any) -> bool:
-        return self._compare(other, lambda x, y: x < y)
+        return self._compare(other, _OP_LT)
 
     def __le__(self, other: Any) -> bool:
-        return self._compare(other, lambda x, y: x <= y)
+        return self._compare(other, _OP_LE)
 
     def __gt__(self, other: Any) -> bool:
-        return self._compare(other, lambda x, y: x > y)
+        return self._compare(other, _OP_GT)
 
     def __ge__(self, other: Any) -> bool:
-        return self._compare(other, lambda x, y: x >= y)
+        return self._compare(other, _OP_GE)
 
     def __or__(self, other: Union["HakkaJsonArray", list, tuple]) -> "HakkaJsonArray":
         """
@@ -816,8 +1113,10 @@ class HakkaJsonArray(HakkaJsonBase):
             raise TypeError("Can only concatenate HakkaJsonArray with HakkaJsonArray.")
         new_array = self.copy()
         result = _extend_array_func(new_array._c_hakka_handle, other._c_hakka_handle)
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to concatenate HakkaJsonArray: {result.name}.")
+        if result:
+            raise RuntimeError(
+                f"Failed to concatenate HakkaJsonArray: {result_name(result)}."
+            )
         return new_array
 
     def __ior__(self, other: Union["HakkaJsonArray", list, tuple]) -> "HakkaJsonArray":
@@ -837,108 +1136,103 @@ class HakkaJsonArray(HakkaJsonBase):
         self.extend(other)
         return self
 
-    def __dir__(self):
-        return super().__dir__() + [
-            "__init__",
-            "_construct",
-            "loads",
-            "to_python",
-            "from_python",
-            "dumps",
-            "__bool__",
-            "__len__",
-            "__getitem__",
-            "__setitem__",
-            "_get_item",
-            "_get_slice",
-            "_set_item",
-            "_set_slice",
-            "__delitem__",
-            "_remove_item",
-            "__contains__",
-            "append",
-            "extend",
-            "insert",
-            "remove",
-            "pop",
-            "clear",
-            "count",
-            "index",
-            "reverse",
-            "copy",
-            "sort",
-            "__add__",
-            "__iadd__",
-            "__mul__",
-            "__rmul__",
-            "__imul__",
-            "__reversed__",
-            "__repr__",
-            "__str__",
-            "__reduce__",
-            "__hash__",
-            "_compare",
-            "__eq__",
-            "__ne__",
-            "__lt__",
-            "__le__",
-            "__gt__",
-            "__ge__",
-            "__or__",
-            "__ior__",
-            "__dir__",
-        ]
+    _DIR = HakkaJsonBase._DIR + (
+        "__init__",
+        "_construct",
+        "loads",
+        "to_python",
+        "from_python",
+        "_dump_buffer",
+        "__bool__",
+        "__len__",
+        "__getitem__",
+        "__setitem__",
+        "_get_item",
+        "_iter_items",
+        "_iter_python_items",
+        "_get_slice",
+        "_set_item",
+        "_set_slice",
+        "__delitem__",
+        "_remove_item",
+        "__contains__",
+        "append",
+        "_push_items",
+        "extend",
+        "insert",
+        "remove",
+        "pop",
+        "clear",
+        "count",
+        "index",
+        "reverse",
+        "copy",
+        "sort",
+        "__add__",
+        "__iadd__",
+        "__mul__",
+        "__rmul__",
+        "__imul__",
+        "__iter__",
+        "__reversed__",
+        "__repr__",
+        "__str__",
+        "_items_repr",
+        "__reduce__",
+        "__hash__",
+        "_compare",
+        "__eq__",
+        "__ne__",
+        "__lt__",
+        "__le__",
+        "__gt__",
+        "__ge__",
+        "__or__",
+        "__ior__",
+        "__dir__",
+    )
 
 
 class HakkaJsonArrayIterator:
     """
     Iterator for HakkaJsonArray.
     Supports forward and reverse iteration.
+
+    Elements are fetched by index, one C call per element instead of a
+    dereference plus an advance on a C iterator. Like list iterators, it
+    stops at the first index that is out of bounds.
     """
 
-    __slots__ = ("_c_iter", "_end")
+    __slots__ = ("_array", "_handle", "_index", "_step")
 
     def __init__(self, array: HakkaJsonArray, reverse: bool = False):
-        self._c_iter = CHakkaArrayIter()
-        create_iter_fn = (
-            _create_array_iter_rbegin_func if reverse else _create_array_iter_begin_func
-        )
-        result = create_iter_fn(array._c_hakka_handle, byref(self._c_iter))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(
-                f"Failed to create HakkaJsonArrayIterator: {result.name}."
-            )
-        self._end = False
+        # _array keeps the array (and so _handle) alive while iterating.
+        self._array = array
+        self._handle = array._c_hakka_handle
+        self._index = len(array) - 1 if reverse else 0
+        self._step = -1 if reverse else 1
 
     def __iter__(self):
         return self
 
     def __next__(self) -> Any:
-        if self._end:
+        index = self._index
+        if index < 0:
             raise StopIteration
 
         value_handle = CHakkaHandle()
-        result = _get_array_iter_deref_func(self._c_iter, byref(value_handle))
-        if result == HakkaJsonResultEnum.HAKKA_JSON_ITERATOR_END:
-            self._end = True
+        result = _get_array_object_func(self._handle, index, value_handle)
+        if result == _INDEX_OUT_OF_BOUNDS:
+            self._index = -1
             raise StopIteration
-        elif result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to dereference iterator: {result.name}.")
-
-        value = handle_to_object(value_handle)
-
-        # Move to next element
-        move_result = _move_array_iter_next_func(self._c_iter)
-        if move_result == HakkaJsonResultEnum.HAKKA_JSON_ITERATOR_END:
-            self._end = True
-        elif move_result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to move iterator: {move_result.name}.")
-
-        return value
+        elif result:
+            raise RuntimeError(
+                f"Failed to get item at index {index}: {result_name(result)}."
+            )
+        self._index = index + self._step
+        return handle_to_object(value_handle)
 
-    def __del__(self):
-        if hasattr(self, "_c_iter") and self._c_iter:
-            _release_array_iter_func(byref(self._c_iter))
+    _DIR = ("__init__", "__iter__", "__next__", "__dir__")
 
     def __dir__(self):
-        return ["__init__", "__iter__", "__next__", "__del__", "__dir__"]
+        return self._DIR
@@ -10,11 +10,14 @@ Additionally, a hack is used to hide "type" information in the __doc__ string.
 The format for the __doc__ string is: "@@type@@, the description of that object".
 """
 
-from ctypes import POINTER, byref, c_uint32, c_ubyte, c_uint64
-from typing import Optional
+import codecs
+import threading
+from collections import deque
+from ctypes import POINTER, Array, c_char, c_uint32, c_ubyte, c_uint64
+from typing import Any, Callable, Dict, Optional, Union
 
 from ._hakka_json_loader import CHakkaHandle, dispatch_table
-from ._hakka_json_enum import HakkaJsonResultEnum, HakkaJsonTypeEnum
+from ._hakka_json_enum import HakkaJsonTypeEnum, result_name
 
 __all__ = ["HakkaJsonBase", "HakkaJsonIteratorBase"]
 
@@ -24,6 +27,117 @@ _hakka_type = dispatch_table["HakkaType"]
 _hakka_dump = dispatch_table["HakkaDump"]
 _hakka_dump_size = dispatch_table["HakkaDumpSize"]
 
+# Allocates the output buffer for _dump_buffer given the required size.
+BufferAllocator = Callable[[int], Array]
+
+
+def json_input_buffer(
+    json_str: Union[str, bytes, bytearray, memoryview],
+) -> Union[bytes, Array]:
+    """
+    Prepare a JSON document for the LoadsHakka* functions.
+
+    str is encoded to UTF-8 and bytes pass through unchanged. Writable
+    buffers, such as a bytearray or a copy-on-write mmap view, are wrapped in
+    place instead of being copied; only other read-only buffers are copied.
+    The parser takes an explicit length, so no NUL terminator is needed and
+    callers pass len() of the result.
+
+    Args:
+        json_str (str | bytes | bytearray | memoryview): The JSON document.
+
+    Returns:
+        bytes | Array: An object accepted as a c_char_p argument.
+    """
+    if isinstance(json_str, str):
+        return json_str.encode("utf-8")
+    if isinstance(json_str, bytes):
+        return json_str
+    view = memoryview(json_str)
+    if view.readonly or not view.c_contiguous:
+        return view.tobytes()
+    return (c_char * view.nbytes).from_buffer(json_str)
+
+
+class _DumpBufferPool:
+    """
+    Reusable output buffers for dumps(), bucketed by power-of-two capacity.
+
+    dumps() decodes the serialized text before returning, so its buffer can be
+    handed to the next call instead of allocating and zero-filling a new one.
+    At most MAX_RETAINED bytes are kept across all buckets; buffers given back
+    beyond that are left to the garbage collector.
+    """
+
+    MIN_CAPACITY = 1 << 12
+    MAX_CAPACITY = 1 << 20
+    MAX_RETAINED = 1 << 22
+    PER_BUCKET = 16
+
+    def __init__(self):
+        self._buckets: Dict[int, deque] = {}
+        self._retained = 0
+        self._lock = threading.Lock()
+
+    @property
+    def retained(self) -> int:
+        """Total capacity of the buffers currently held by the pool."""
+        return self._retained
+
+    def rent(self, size: int) -> bytearray:
+        if size > self.MAX_CAPACITY:
+            # Never pooled, so allocate exactly what was asked for.
+            return bytearray(size)
+        capacity = max(self.MIN_CAPACITY, 1 << (size - 1).bit_length())
+        with self._lock:
+            bucket = self._buckets.get(capacity)
+            if bucket:
+                self._retained -= capacity
+                return bucket.pop()
+        return bytearray(capacity)
+
+    def give_back(self, buffer: bytearray) -> None:
+        capacity = len(buffer)
+        if capacity > self.MAX_CAPACITY:
+            return
+        with self._lock:
+            if self._retained + capacity > self.MAX_RETAINED:
+                return
+            bucket = self._buckets.get(capacity)
+            if bucket is None:
+                bucket = self._buckets[capacity] = deque()
+            elif len(bucket) >= self.PER_BUCKET:
+                return
+            bucket.append(buffer)
+            self._retained += capacity
+
+
+_dump_pool = _DumpBufferPool()
+
+
+class _PooledAllocator:
+    """
+    BufferAllocator that rents from _dump_pool; release() returns the buffers.
+
+    Only for callers that copy the dumped bytes out before releasing, since
+    the same memory is handed to the next dump afterwards.
+    """
+
+    __slots__ = ("_rented",)
+
+    def __init__(self):
+        self._rented = []
+
+    def __call__(self, size: int) -> Array:
+        buffer = _dump_pool.rent(size)
+        self._rented.append(buffer)
+        return (c_ubyte * size).from_buffer(buffer)
+
+    def release(self) -> None:
+        for buffer in self._rented:
+            _dump_pool.give_back(buffer)
+        self._rented.clear()
+
 
 class HakkaJsonIteratorBase:
     """
@@ -74,8 +188,9 @@ class HakkaJsonBase:
         """
         Destructor to free the underlying C HakkaJson object.
         """
-        if hasattr(self, "_c_hakka_handle") and self._c_hakka_handle:
-            _hakka_release(byref(self._c_hakka_handle))
+        handle = getattr(self, "_c_hakka_handle", None)
+        if handle:
+            _hakka_release(handle)
             self._c_hakka_handle = None
 
     def get_type(self) -> HakkaJsonTypeEnum:
@@ -86,36 +201,116 @@ class HakkaJsonBase:
             HakkaJsonTypeEnum: The type of the JSON object.
         """
         type_id = c_uint32(-1)
-        result = _hakka_type(self._c_hakka_handle, byref(type_id))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to get type of HakkaJson object {result.name}.")
+        result = _hakka_type(self._c_hakka_handle, type_id)
+        if result:
+            raise RuntimeError(
+                f"Failed to get type of HakkaJson object {result_name(result)}."
+            )
         return HakkaJsonTypeEnum(type_id.value)
 
-    def dumps(self, max_depth: int = 512) -> str:
+    def _dump_buffer(
+        self, max_depth: int, allocate: Optional[BufferAllocator] = None
+    ) -> memoryview:
         """
-        Dump the JSON object to a string.
+        Serialize the JSON object into a C buffer.
 
         Args:
             max_depth (int): The maximum depth to dump.
+            allocate (Callable, optional): Returns a writable c_ubyte array of at
+                least the given size. Defaults to a fresh zeroed array.
 
         Returns:
-            str: The JSON string.
+            memoryview: A byte view over the UTF-8 encoded JSON text.
         """
         # extern_c HakkaJsonResultEnum HakkaDump(HakkaHandle handle, uint32_t max_depth, uint8_t *buffer, uint32_t *buffer_size);
         # Get the capacity what we need to allocate.
         buffer_size = c_uint64()
-        result = _hakka_dump_size(self._c_hakka_handle, byref(buffer_size))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        result = _hakka_dump_size(self._c_hakka_handle, buffer_size)
+        if result:
             raise RuntimeError("Failed to get the size of the buffer.")
 
         # Allocate the buffer.
-        buffer = (c_ubyte * buffer_size.value)()
-        result = _hakka_dump(
-            self._c_hakka_handle, max_depth, buffer, byref(buffer_size)
+        buffer = (
+            allocate(buffer_size.value)
+            if allocate is not None
+            else (c_ubyte * buffer_size.value)()
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        result = _hakka_dump(self._c_hakka_handle, max_depth, buffer, buffer_size)
+        if result:
             raise RuntimeError("Failed to dump HakkaJson object.")
-        return bytes(buffer[: buffer_size.value]).decode("utf-8")
+        return memoryview(buffer).cast("B")[: buffer_size.value]
+
+    def dumps(self, max_depth: int = 512) -> str:
+        """
+        Dump the JSON object to a string.
+
+        Args:
+            max_depth (int): The maximum depth to dump.
+
+        Returns:
+            str: The JSON string.
+        """
+        allocate = _PooledAllocator()
+        view = self._dump_buffer(max_depth, allocate)
+        try:
+            return codecs.utf_8_decode(view, None, True)[0]
+        finally:
+            view.release()
+            allocate.release()
+
+    def dump_to(
+        self,
+        writer: Callable[[Any], Any],
+        max_depth: int = 512,
+        chunk_size: int = 65536,
+        binary: bool = False,
+    ) -> int:
+        """
+        Dump the JSON object by feeding it to a writer in chunks.
+
+        The serialized text is handed to the writer straight from the C buffer,
+        so no full-size Python string is built alongside it.
+
+        Args:
+            writer (Callable): Called once per chunk, e.g. ``file.write``.
+            max_depth (int): The maximum depth to dump.
+            chunk_size (int): The number of bytes per chunk.
+            binary (bool): Pass UTF-8 byte chunks instead of ``str`` chunks.
+
+        Returns:
+            int: The number of bytes (binary) or characters (text) written.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive.")
+        written = 0
+        if binary:
+            # The writer receives views into the buffer and may keep them, so
+            # it gets a buffer of its own rather than a pooled one.
+            view = self._dump_buffer(max_depth)
+            for start in range(0, len(view), chunk_size):
+                chunk = view[start : start + chunk_size]
+                writer(chunk)
+                written += len(chunk)
+            return written
+        # Text chunks are decoded copies, so the buffer can go back to the pool.
+        allocate = _PooledAllocator()
+        view = self._dump_buffer(max_depth, allocate)
+        try:
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            for start in range(0, len(view), chunk_size):
+                with view[start : start + chunk_size] as chunk:
+                    text = decoder.decode(chunk)
+                if text:
+                    writer(text)
+                    written += len(text)
+            text = decoder.decode(b"", True)
+            if text:
+                writer(text)
+                written += len(text)
+            return written
+        finally:
+            view.release()
+            allocate.release()
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}()"
@@ -123,13 +318,17 @@ class HakkaJsonBase:
     def __str__(self) -> str:
         return self.dumps()
 
+    # Names reported by __dir__, built once; subclasses extend this tuple.
+    _DIR = (
+        "__init__",
+        "__del__",
+        "get_type",
+        "dumps",
+        "dump_to",
+        "__repr__",
+        "__str__",
+        "__dir__",
+    )
+
     def __dir__(self):
-        return [
-            "__init__",
-            "__del__",
-            "get_type",
-            "dumps",
-            "__repr__",
-            "__str__",
-            "__dir__",
-        ]
+        return self._DIR
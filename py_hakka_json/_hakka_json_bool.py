@@ -7,11 +7,10 @@ Represents a JSON boolean value in HakkaJson.
 Implements singleton pattern with HakkaJsonTrue and HakkaJsonFalse.
 """
 
-from ctypes import byref, c_uint8, c_int32, c_uint64
+from ctypes import c_uint8, c_uint64
 
 from ._hakka_json_base import HakkaJsonBase
 from ._hakka_json_loader import CHakkaHandle, dispatch_table
-from ._hakka_json_enum import HakkaJsonResultEnum
 
 
 __all__ = ["HakkaJsonBool", "HakkaJsonTrue", "HakkaJsonFalse"]
@@ -19,15 +18,14 @@ __all__ = ["HakkaJsonBool", "HakkaJsonTrue", "HakkaJsonFalse"]
 # Dispatch functions for boolean manipulation
 _create_bool_func = dispatch_table["CreateHakkaBool"]
 _get_bool_func = dispatch_table["GetHakkaBool"]
-_compare_func = dispatch_table["HakkaCompare"]
 _hash_func = dispatch_table["HakkaHash"]
 
 
 def setup_tf_handles(value: bool):
     c_hakka_handle = CHakkaHandle()
     c_bool_value = c_uint8(1 if value else 0)
-    result = _create_bool_func(byref(c_hakka_handle), c_bool_value)
-    if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+    result = _create_bool_func(c_hakka_handle, c_bool_value)
+    if result:
         raise RuntimeError("Failed to create HakkaJsonBool.")
     return c_hakka_handle
 
@@ -35,6 +33,10 @@ def setup_tf_handles(value: bool):
 _true_handle = setup_tf_handles(True)
 _false_handle = setup_tf_handles(False)
 
+# Exact operand types accepted by the bitwise operators without an isinstance
+# walk; HakkaJsonBool operands are unwrapped first.
+_INT_TYPES = frozenset((bool, int))
+
 
 class HakkaJsonBool(HakkaJsonBase):
     """
@@ -42,20 +44,29 @@ class HakkaJsonBool(HakkaJsonBase):
     Implements singleton pattern with HakkaJsonTrue and HakkaJsonFalse.
     """
 
-    __slots__ = ()
+    __slots__ = ("_py_value", "_hash_value")
 
-    _internal_shared_bool_singleton = {}  # Class attribute to hold singleton instances
+    # The two singleton instances, created on first use.
+    _TRUE_SINGLETON = None
+    _FALSE_SINGLETON = None
 
     def __new__(cls, value: bool):
         """
         Ensure that only one instance exists for True and False.
         """
-        value = bool(value)
-        if value not in cls._internal_shared_bool_singleton:
-            instance = super(HakkaJsonBool, cls).__new__(cls)
-            instance._initialize(value)
-            cls._internal_shared_bool_singleton[value] = instance
-        return cls._internal_shared_bool_singleton[value]
+        if value:
+            instance = HakkaJsonBool._TRUE_SINGLETON
+            if instance is None:
+                instance = super(HakkaJsonBool, cls).__new__(cls)
+                instance._initialize(True)
+                HakkaJsonBool._TRUE_SINGLETON = instance
+        else:
+            instance = HakkaJsonBool._FALSE_SINGLETON
+            if instance is None:
+                instance = super(HakkaJsonBool, cls).__new__(cls)
+                instance._initialize(False)
+                HakkaJsonBool._FALSE_SINGLETON = instance
+        return instance
 
     @staticmethod
     def handle_to_tf(handle: CHakkaHandle) -> bool:
@@ -63,8 +74,8 @@ class HakkaJsonBool(HakkaJsonBase):
         Convert a CHakkaHandle to a Python bool.
         """
         out_bool = c_uint8()
-        result = _get_bool_func(handle, byref(out_bool))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        result = _get_bool_func(handle, out_bool)
+        if result:
             raise RuntimeError("Failed to retrieve boolean value from HakkaJsonBool.")
         return bool(out_bool.value)
 
@@ -78,119 +89,121 @@ class HakkaJsonBool(HakkaJsonBase):
         """
         Convert a CHakkaHandle to a HakkaJsonBool instance.
         """
-        tof = HakkaJsonBool.handle_to_tf(handle)
-        return HakkaJsonTrue if tof else HakkaJsonFalse
+        # Handles that point at one of the singletons' own C values need no
+        # C call; anything else is read through GetHakkaBool.
+        instance = _instances_by_handle.get(handle.value)
+        if instance is not None:
+            return instance
+        return _instances[HakkaJsonBool.handle_to_tf(handle)]
 
     def _initialize(self, value: bool):
         """
         Internal method to initialize a HakkaJsonBool object.
         """
-        if issubclass(type(value), HakkaJsonBase):
-            value = self.handle_to_tf(value._c_hakka_handle)
-        value = bool(value)
-        if value:
-            self._c_hakka_handle = _true_handle
-        else:
-            self._c_hakka_handle = _false_handle
-        super().__init__(self._c_hakka_handle)
+        if type(value) is not bool:
+            if isinstance(value, HakkaJsonBase):
+                value = self.handle_to_tf(value._c_hakka_handle)
+            value = bool(value)
+        self._c_hakka_handle = _true_handle if value else _false_handle
+        # The singletons are immutable, so the Python value and the hash are
+        # fixed here instead of being fetched from C on every use.
+        self._py_value = value
+        hash_value = c_uint64()
+        result = _hash_func(self._c_hakka_handle, hash_value)
+        if result:
+            raise RuntimeError("Failed to compute hash for HakkaJsonBool.")
+        self._hash_value = hash_value.value
 
     def __bool__(self) -> bool:
         """
         Return the boolean value.
         """
-        return self.to_python()
+        return self._py_value
 
     def to_python(self) -> bool:
         """
         Convert the HakkaJsonBool to a Python bool.
         """
-        out_bool = c_uint8()
-        result = _get_bool_func(self._c_hakka_handle, byref(out_bool))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError("Failed to retrieve boolean value from HakkaJsonBool.")
-        return bool(out_bool.value)
+        return self._py_value
 
     @staticmethod
     def from_python(value: bool) -> "HakkaJsonBool":
         """
         Create a HakkaJsonBool from a Python bool.
         """
-        return HakkaJsonTrue if value else HakkaJsonFalse
+        return _instances[bool(value)]
 
-    def _compare(self, other, op) -> bool:
+    def _raw_compare(self, other):
         """
-        Compare this HakkaJsonBool with another value using a comparison operation.
+        Compare this HakkaJsonBool with another value.
 
         Args:
             other (HakkaJsonBool or bool): The value to compare against.
-            op (callable): The comparison operation.
 
         Returns:
-            bool: The result of the comparison.
+            int: Negative, zero or positive as self is less than, equal to or
+                greater than other, or NotImplemented for other types.
         """
         if isinstance(other, HakkaJsonBool):
-            other_handle = other._c_hakka_handle  # pylint: disable=protected-access
+            other_value = other._py_value  # pylint: disable=protected-access
         elif isinstance(other, bool):
-            other_handle = HakkaJsonBool.from_python(other)._c_hakka_handle
+            other_value = other
         else:
             return NotImplemented
 
-        comparison_result = c_int32()
-        result = _compare_func(
-            self._c_hakka_handle, other_handle, byref(comparison_result)
-        )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError("Comparison failed.")
-        return op(comparison_result.value, 0)
+        # Both sides are plain bools here, which order False < True.
+        return self._py_value - other_value
 
     def __eq__(self, other) -> bool:
-        return self._compare(other, lambda x, y: x == y)
+        value = self._raw_compare(other)
+        return value if value is NotImplemented else value == 0
 
     def __ge__(self, other) -> bool:
-        return self._compare(other, lambda x, y: x >= y)
+        value = self._raw_compare(other)
+        return value if value is NotImplemented else value >= 0
 
     def __gt__(self, other) -> bool:
-        return self._compare(other, lambda x, y: x > y)
+        value = self._raw_compare(other)
+        return value if value is NotImplemented else value > 0
 
     def __le__(self, other) -> bool:
-        return self._compare(other, lambda x, y: x <= y)
+        value = self._raw_compare(other)
+        return value if value is NotImplemented else value <= 0
 
     def __lt__(self, other) -> bool:
-        return self._compare(other, lambda x, y: x < y)
+        value = self._raw_compare(other)
+        return value if value is NotImplemented else value < 0
 
     def __ne__(self, other) -> bool:
-        return self._compare(other, lambda x, y: x != y)
+        value = self._raw_compare(other)
+        return value if value is NotImplemented else value != 0
 
     def __hash__(self) -> int:
         """
         Get the hash of the HakkaJsonBool object.
         """
-        hash_value = c_uint64()
-        result = _hash_func(self._c_hakka_handle, byref(hash_value))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError("Failed to compute hash for HakkaJsonBool.")
-        return hash_value.value
+        return self._hash_value
 
     def __reduce__(self):
         """
         Support for pickle.
         """
-        return (HakkaJsonBool.from_python, (self.to_python(),))
+        return (HakkaJsonBool.from_python, (self._py_value,))
 
     def __repr__(self) -> str:
-        return "HakkaJsonTrue" if self.to_python() else "HakkaJsonFalse"
+        return "HakkaJsonTrue" if self._py_value else "HakkaJsonFalse"
 
     def __str__(self) -> str:
-        return "True" if self.to_python() else "False"
+        return "True" if self._py_value else "False"
 
     def __int__(self) -> int:
-        return int(self.to_python())
+        return int(self._py_value)
 
     def __float__(self) -> float:
-        return float(self.to_python())
+        return float(self._py_value)
 
     def __index__(self) -> int:
-        return int(self.to_python())
+        return int(self._py_value)
 
     def __copy__(self) -> "HakkaJsonBool":
         return self
@@ -215,14 +228,14 @@ class HakkaJsonBool(HakkaJsonBase):
         Perform an arithmetic operation and return a result.
         """
         if isinstance(other, HakkaJsonBool):
-            other_value = other.to_python()
+            other_value = other._py_value  # pylint: disable=protected-access
         elif isinstance(other, bool):
             other_value = other
         elif isinstance(other, (int, float)):
             other_value = other
         else:
             return NotImplemented
-        return op(self.to_python(), other_value)
+        return op(self._py_value, other_value)
 
     # Arithmetic Operations
     def __add__(self, other):
@@ -277,60 +290,66 @@ class HakkaJsonBool(HakkaJsonBase):
 
     # Unary Operations
     def __neg__(self):
-        return -self.to_python()
+        return -self._py_value
 
     def __pos__(self):
-        return +self.to_python()
+        return +self._py_value
 
     def __abs__(self):
-        return abs(self.to_python())
+        return abs(self._py_value)
 
     def __invert__(self):
-        return ~int(self.to_python())
+        return ~int(self._py_value)
 
     # Bitwise Operations
     def __and__(self, other):
-        if isinstance(other, (HakkaJsonBool, bool, int)):
-            return self.to_python() & other
-        return NotImplemented
+        if type(other) is HakkaJsonBool:
+            other = other._py_value  # pylint: disable=protected-access
+        elif type(other) not in _INT_TYPES and not isinstance(other, int):
+            return NotImplemented
+        return self._py_value & other
 
     def __rand__(self, other):
         return self.__and__(other)
 
     def __or__(self, other):
-        if isinstance(other, (HakkaJsonBool, bool, int)):
-            return self.to_python() | other
-        return NotImplemented
+        if type(other) is HakkaJsonBool:
+            other = other._py_value  # pylint: disable=protected-access
+        elif type(other) not in _INT_TYPES and not isinstance(other, int):
+            return NotImplemented
+        return self._py_value | other
 
     def __ror__(self, other):
         return self.__or__(other)
 
     def __xor__(self, other):
-        if isinstance(other, (HakkaJsonBool, bool, int)):
-            return self.to_python() ^ other
-        return NotImplemented
+        if type(other) is HakkaJsonBool:
+            other = other._py_value  # pylint: disable=protected-access
+        elif type(other) not in _INT_TYPES and not isinstance(other, int):
+            return NotImplemented
+        return self._py_value ^ other
 
     def __rxor__(self, other):
         return self.__xor__(other)
 
     def __lshift__(self, other):
         if isinstance(other, int):
-            return int(self.to_python()) << other
+            return int(self._py_value) << other
         return NotImplemented
 
     def __rlshift__(self, other):
         if isinstance(other, int):
-            return other << int(self.to_python())
+            return other << int(self._py_value)
         return NotImplemented
 
     def __rshift__(self, other):
         if isinstance(other, int):
-            return int(self.to_python()) >> other
+            return int(self._py_value) >> other
         return NotImplemented
 
     def __rrshift__(self, other):
         if isinstance(other, int):
-            return other >> int(self.to_python())
+            return other >> int(self._py_value)
         return NotImplemented
 
     # Mathematical Methods
@@ -350,12 +369,12 @@ class HakkaJsonBool(HakkaJsonBase):
         """
         Returns a pair of integers whose ratio is exactly equal to the original boolean.
         """
-        return (int(self.to_python()), 1)
+        return (int(self._py_value), 1)
 
     @classmethod
     def from_bytes(cls, source_bytes, byteorder, signed=False):
         value = bool(int.from_bytes(source_bytes, byteorder, signed=signed))
-        return cls(True) if value else cls(False)
+        return _instances[value]
 
     def to_bytes(self, length: int, byteorder: str) -> bytes:
         """
@@ -376,20 +395,20 @@ class HakkaJsonBool(HakkaJsonBase):
             raise ValueError("Booleans require exactly 1 byte.")
         if byteorder not in ("big", "little"):
             raise ValueError("byteorder must be either 'big' or 'little'")
-        return (1 if self.to_python() else 0).to_bytes(1, byteorder)
+        return (1 if self._py_value else 0).to_bytes(1, byteorder)
 
     # Representation and Pickling
     def __getnewargs__(self) -> tuple:
         """
         Support for pickle.
         """
-        return (self.to_python(),)
+        return (self._py_value,)
 
     def __getstate__(self):
         """
         Get the state for pickling.
         """
-        return self.to_python()
+        return self._py_value
 
     def __setstate__(self, state):
         """
@@ -404,7 +423,7 @@ class HakkaJsonBool(HakkaJsonBase):
         """
         Implements the format protocol.
         """
-        return format(self.to_python(), format_spec)
+        return format(self._py_value, format_spec)
 
     def __getformat__(self, format_type: str) -> str:
         """
@@ -419,13 +438,13 @@ class HakkaJsonBool(HakkaJsonBase):
         """
         Return the number of set bits in the integer representation.
         """
-        return int(self.to_python()).bit_count()
+        return int(self._py_value).bit_count()
 
     def bit_length(self) -> int:
         """
         Return the number of bits necessary to represent the integer in binary.
         """
-        return int(self.to_python()).bit_length()
+        return int(self._py_value).bit_length()
 
     def denominator(self) -> int:
         """
@@ -437,7 +456,7 @@ class HakkaJsonBool(HakkaJsonBase):
         """
         The numerator of a boolean is 1 for True and 0 for False.
         """
-        return int(self.to_python())
+        return int(self._py_value)
 
     def real(self) -> "HakkaJsonBool":
         """
@@ -451,79 +470,85 @@ class HakkaJsonBool(HakkaJsonBase):
         """
         raise AttributeError("'bool' object has no attribute 'imag'")
 
-    def __dir__(self):
-        return super().__dir__() + [
-            "__new__",
-            "__init__",
-            "__bool__",
-            "to_python",
-            "from_python",
-            "_compare",
-            "__eq__",
-            "__ge__",
-            "__gt__",
-            "__le__",
-            "__lt__",
-            "__ne__",
-            "__hash__",
-            "__reduce__",
-            "__repr__",
-            "__str__",
-            "__int__",
-            "__float__",
-            "__index__",
-            "__copy__",
-            "__deepcopy__",
-            "__getitem__",
-            "__len__",
-            "_arithmetic",
-            "__add__",
-            "__sub__",
-            "__mul__",
-            "__truediv__",
-            "__floordiv__",
-            "__mod__",
-            "__pow__",
-            "__radd__",
-            "__rsub__",
-            "__rmul__",
-            "__rtruediv__",
-            "__rfloordiv__",
-            "__rmod__",
-            "__rpow__",
-            "__neg__",
-            "__pos__",
-            "__abs__",
-            "__invert__",
-            "__and__",
-            "__rand__",
-            "__or__",
-            "__ror__",
-            "__xor__",
-            "__rxor__",
-            "__lshift__",
-            "__rlshift__",
-            "__rshift__",
-            "__rrshift__",
-            "conjugate",
-            "is_integer",
-            "as_integer_ratio",
-            "from_bytes",
-            "to_bytes",
-            "__getnewargs__",
-            "__getstate__",
-            "__setstate__",
-            "__format__",
-            "__getformat__",
-            "bit_count",
-            "bit_length",
-            "denominator",
-            "numerator",
-            "real",
-            "imag",
-        ]
+    _DIR = HakkaJsonBase._DIR + (
+        "__new__",
+        "__init__",
+        "__bool__",
+        "to_python",
+        "from_python",
+        "_raw_compare",
+        "__eq__",
+        "__ge__",
+        "__gt__",
+        "__le__",
+        "__lt__",
+        "__ne__",
+        "__hash__",
+        "__reduce__",
+        "__repr__",
+        "__str__",
+        "__int__",
+        "__float__",
+        "__index__",
+        "__copy__",
+        "__deepcopy__",
+        "__getitem__",
+        "__len__",
+        "_arithmetic",
+        "__add__",
+        "__sub__",
+        "__mul__",
+        "__truediv__",
+        "__floordiv__",
+        "__mod__",
+        "__pow__",
+        "__radd__",
+        "__rsub__",
+        "__rmul__",
+        "__rtruediv__",
+        "__rfloordiv__",
+        "__rmod__",
+        "__rpow__",
+        "__neg__",
+        "__pos__",
+        "__abs__",
+        "__invert__",
+        "__and__",
+        "__rand__",
+        "__or__",
+        "__ror__",
+        "__xor__",
+        "__rxor__",
+        "__lshift__",
+        "__rlshift__",
+        "__rshift__",
+        "__rrshift__",
+        "conjugate",
+        "is_integer",
+        "as_integer_ratio",
+        "from_bytes",
+        "to_bytes",
+        "__getnewargs__",
+        "__getstate__",
+        "__setstate__",
+        "__format__",
+        "__getformat__",
+        "bit_count",
+        "bit_length",
+        "denominator",
+        "numerator",
+        "real",
+        "imag",
+    )
 
 
 # Singleton instances
 HakkaJsonTrue = HakkaJsonBool(True)
 HakkaJsonFalse = HakkaJsonBool(False)
+
+# Lookup tables for handle_to_instance, indexed by bool and by C handle value.
+_instances = (HakkaJsonFalse, HakkaJsonTrue)
+_instances_by_handle = {
+    _false_handle.value: HakkaJsonFalse,
+    _true_handle.value: HakkaJsonTrue,
+}
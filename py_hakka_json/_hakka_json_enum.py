@@ -7,6 +7,7 @@ from enum import IntEnum
 __all__ = [
     "HakkaJsonResultEnum",
     "HakkaJsonTypeEnum",
+    "result_name",
 ]
 
 
@@ -37,3 +38,13 @@ class HakkaJsonTypeEnum(IntEnum):
     HAKKA_JSON_OBJECT = 5
     HAKKA_JSON_ARRAY = 6
     HAKKA_JSON_INVALID = -1
+
+
+# Result code -> member name, so bindings that return a plain int can format
+# errors without constructing an enum (which also fails on unknown codes).
+_RESULT_NAMES = {member.value: member.name for member in HakkaJsonResultEnum}
+
+
+def result_name(result: int) -> str:
+    """Return the HakkaJsonResultEnum name for a raw result code."""
+    return _RESULT_NAMES.get(result, f"UNKNOWN_RESULT_{result}")
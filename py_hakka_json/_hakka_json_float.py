@@ -7,12 +7,14 @@ HakkaJsonFloat class definition.
 Represents a JSON float value in HakkaJson.
 """
 
+import threading
 from ctypes import byref, c_double, c_int32, c_uint64
-from math import ceil, floor, trunc
+from math import ceil, copysign, floor, inf, trunc
+from operator import add, eq, floordiv, ge, gt, le, lt, mod, mul, ne, sub
 
 from ._hakka_json_base import HakkaJsonBase
 from ._hakka_json_loader import CHakkaHandle, dispatch_table
-from ._hakka_json_enum import HakkaJsonResultEnum, HakkaJsonTypeEnum
+from ._hakka_json_enum import HakkaJsonTypeEnum
 
 
 __all__ = ["HakkaJsonFloat"]
@@ -22,6 +24,38 @@ _create_float_func = dispatch_table["CreateHakkaFloat"]
 _get_float_func = dispatch_table["GetHakkaFloat"]
 _compare_func = dispatch_table["HakkaCompare"]
 _hash_func = dispatch_table["HakkaHash"]
+_release_func = dispatch_table["HakkaRelease"]
+
+
+class _Scratch(threading.local):
+    """
+    Per-thread out-parameters for C calls whose result is read back right away.
+    """
+
+    def __init__(self):
+        self.f64 = c_double()
+        self.f64_ref = byref(self.f64)
+        self.u64 = c_uint64()
+        self.u64_ref = byref(self.u64)
+        self.i32 = c_int32()
+        self.i32_ref = byref(self.i32)
+
+
+_scratch = _Scratch()
+
+# Exact operand types taken as native numbers without an isinstance walk.
+_NUMBER_TYPES = frozenset((float, int))
+
+# The handle slot declared by HakkaJsonBase. HakkaJsonFloat shadows it with a
+# property so values produced by Python-side arithmetic get a handle lazily.
+_handle_slot = HakkaJsonBase._c_hakka_handle
+# Serializes the lazy creation so concurrent first reads build one handle.
+_lazy_handle_lock = threading.Lock()
+
+# Shared instances for common constants, filled in after the class. NaN is
+# left out since it never compares equal to itself as a key. Only _from_float
+# hands them out, so objects built with HakkaJsonFloat(value) stay distinct.
+_SMALL_CACHE = {}
 
 
 class HakkaJsonFloat(HakkaJsonBase):
@@ -29,7 +63,9 @@ class HakkaJsonFloat(HakkaJsonBase):
     Represents a JSON float value in HakkaJson.
     """
 
-    __slots__ = ()
+    # The Python value (recorded at construction) and the hash (computed on
+    # first use); both are fixed since the object is immutable.
+    __slots__ = ("_cached_value", "_cached_hash")
 
     @staticmethod
     def _construct(value: float) -> CHakkaHandle:
@@ -43,8 +79,8 @@ class HakkaJsonFloat(HakkaJsonBase):
             CHakkaHandle: The handle to the HakkaJsonFloat object.
         """
         c_hakka_handle = CHakkaHandle()
-        result = _create_float_func(byref(c_hakka_handle), value)
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        result = _create_float_func(c_hakka_handle, value)
+        if result:
             raise RuntimeError("Failed to create HakkaJsonFloat.")
         return c_hakka_handle
 
@@ -55,23 +91,93 @@ class HakkaJsonFloat(HakkaJsonBase):
         Args:
             value (float or HakkaJsonBase or HakkaJsonFloat): The value to initialize.
         """
-        if isinstance(value, HakkaJsonFloat):
-            self._c_hakka_handle = HakkaJsonFloat._construct(value.to_python())
+        if type(value) is float:
+            # The common case: store the handle and value straight into the
+            # slots, skipping the property setter and HakkaJsonBase.__init__.
+            _handle_slot.__set__(self, HakkaJsonFloat._construct(value))
+            object.__setattr__(self, "_cached_value", value)
+            return
+        if type(value) is int:
+            py_value = float(value)
+        elif isinstance(value, HakkaJsonFloat):
+            py_value = value.to_python()
         elif isinstance(value, (int, float)):
-            self._c_hakka_handle = HakkaJsonFloat._construct(float(value))
+            py_value = float(value)
         elif isinstance(value, HakkaJsonBase):
             if value.get_type() != HakkaJsonTypeEnum.HAKKA_JSON_FLOAT:
                 raise TypeError("Invalid type for HakkaJsonFloat initialization.")
-            out_float = c_double()
-            result = _get_float_func(value._c_hakka_handle, byref(out_float))
-            if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+            scratch = _scratch
+            result = _get_float_func(value._c_hakka_handle, scratch.f64_ref)
+            if result:
                 raise RuntimeError(
                     "Failed to retrieve float value from HakkaJsonFloat."
                 )
-            self._c_hakka_handle = HakkaJsonFloat._construct(out_float.value)
+            py_value = scratch.f64.value
         else:
             raise TypeError("Invalid type for HakkaJsonFloat initialization.")
-        super().__init__(self._c_hakka_handle)
+        _handle_slot.__set__(self, HakkaJsonFloat._construct(py_value))
+        object.__setattr__(self, "_cached_value", py_value)
+
+    @classmethod
+    def _from_float(cls, value) -> "HakkaJsonFloat":
+        """
+        Wrap the result of a Python-side operation.
+
+        A float result only records its value; the C object is created the
+        first time _c_hakka_handle is read, which many results never need.
+        Common constants come from the shared cache instead. Anything that
+        is not a float goes through the regular constructor.
+
+        Args:
+            value: The result value.
+
+        Returns:
+            HakkaJsonFloat: The wrapped value.
+        """
+        if type(value) is not float:
+            return cls(value)
+        cached = _SMALL_CACHE.get(value)
+        # -0.0 looks up the entry for 0.0 and must not share it.
+        if cached is not None and (value or copysign(1.0, value) > 0):
+            return cached
+        obj = cls.__new__(cls)
+        object.__setattr__(obj, "_cached_value", value)
+        return obj
+
+    @property
+    def _c_hakka_handle(self) -> CHakkaHandle:
+        """
+        The handle to the C object, created on first access for lazy values.
+        """
+        try:
+            return _handle_slot.__get__(self, HakkaJsonFloat)
+        except AttributeError:
+            pass
+        with _lazy_handle_lock:
+            # Another thread may have created it while this one waited.
+            try:
+                return _handle_slot.__get__(self, HakkaJsonFloat)
+            except AttributeError:
+                pass
+            handle = HakkaJsonFloat._construct(self._cached_value)
+            _handle_slot.__set__(self, handle)
+        return handle
+
+    @_c_hakka_handle.setter
+    def _c_hakka_handle(self, handle) -> None:
+        _handle_slot.__set__(self, handle)
+
+    def __del__(self) -> None:
+        """
+        Free the C object, if one was ever created.
+        """
+        try:
+            handle = _handle_slot.__get__(self, HakkaJsonFloat)
+        except AttributeError:
+            return
+        if handle:
+            _release_func(handle)
+            _handle_slot.__set__(self, None)
 
     def __bool__(self) -> bool:
         """
@@ -89,11 +195,17 @@ class HakkaJsonFloat(HakkaJsonBase):
         Returns:
             float: The float value.
         """
-        out_float = c_double()
-        result = _get_float_func(self._c_hakka_handle, byref(out_float))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        try:
+            return self._cached_value
+        except AttributeError:
+            pass
+        scratch = _scratch
+        result = _get_float_func(self._c_hakka_handle, scratch.f64_ref)
+        if result:
             raise RuntimeError("Failed to retrieve float value from HakkaJsonFloat.")
-        return out_float.value
+        value = scratch.f64.value
+        object.__setattr__(self, "_cached_value", value)
+        return value
 
     @staticmethod
     def from_python(value: float) -> "HakkaJsonFloat":
@@ -110,52 +222,51 @@ class HakkaJsonFloat(HakkaJsonBase):
 
     def _compare(self, other, op) -> bool:
         """
-        Compare this HakkaJsonFloat with another value using a comparison operation.
+        Compare this HakkaJsonFloat with another value.
 
         Args:
-            other (HakkaJsonFloat or float): The value to compare against.
-            op (callable): The comparison operation.
+            other (HakkaJsonFloat or float or int): The value to compare against.
+            op: The comparison operator, e.g. operator.lt.
 
         Returns:
-            bool: The result of the comparison.
-        """
-        if isinstance(other, HakkaJsonFloat):
-            other_handle = other._c_hakka_handle  # pylint: disable=protected-access
-        elif isinstance(other, (int, float)):
-            other_handle = CHakkaHandle()
-            # Create a temporary HakkaJsonFloat for comparison
-            temp_float = HakkaJsonFloat.from_python(float(other))
-            other_handle = (
-                temp_float._c_hakka_handle  # pylint: disable=protected-access
-            )
-        else:
+            bool: The result of the comparison, or NotImplemented for other types.
+        """
+        other_type = type(other)
+        if other_type is not HakkaJsonFloat and (
+            other_type in _NUMBER_TYPES or isinstance(other, (int, float))
+        ):
+            # Compare the native values in Python rather than wrapping the
+            # operand in a temporary HakkaJsonFloat just to hand its handle to
+            # C. The operand is not converted to float, so NaN stays unordered
+            # and ints beyond float range compare exactly instead of raising.
+            return op(self.to_python(), other)
+        if other_type is not HakkaJsonFloat and not isinstance(other, HakkaJsonFloat):
             return NotImplemented
+        other_handle = other._c_hakka_handle  # pylint: disable=protected-access
 
-        comparison_result = c_int32()
-        result = _compare_func(
-            self._c_hakka_handle, other_handle, byref(comparison_result)
-        )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        scratch = _scratch
+        result = _compare_func(self._c_hakka_handle, other_handle, scratch.i32_ref)
+        if result:
             raise RuntimeError("Comparison failed.")
-        return op(comparison_result.value, 0)
+        return op(scratch.i32.value, 0)
 
     def __eq__(self, other) -> bool:
-        return self._compare(other, lambda x, y: x == y)
+        return self._compare(other, eq)
 
     def __ge__(self, other) -> bool:
-        return self._compare(other, lambda x, y: x >= y)
+        return self._compare(other, ge)
 
     def __gt__(self, other) -> bool:
-        return self._compare(other, lambda x, y: x > y)
+        return self._compare(other, gt)
 
     def __le__(self, other) -> bool:
-        return self._compare(other, lambda x, y: x <= y)
+        return self._compare(other, le)
 
     def __lt__(self, other) -> bool:
-        return self._compare(other, lambda x, y: x < y)
+        return self._compare(other, lt)
 
     def __ne__(self, other) -> bool:
-        return self._compare(other, lambda x, y: x != y)
+        return self._compare(other, ne)
 
     def __hash__(self) -> int:
         """
@@ -164,11 +275,17 @@ class HakkaJsonFloat(HakkaJsonBase):
         Returns:
             int: The hash value.
         """
-        hash_value = c_uint64()
-        result = _hash_func(self._c_hakka_handle, byref(hash_value))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        try:
+            return self._cached_hash
+        except AttributeError:
+            pass
+        scratch = _scratch
+        result = _hash_func(self._c_hakka_handle, scratch.u64_ref)
+        if result:
             raise RuntimeError("Failed to compute hash for HakkaJsonFloat.")
-        return hash_value.value
+        hash_value = scratch.u64.value
+        object.__setattr__(self, "_cached_hash", hash_value)
+        return hash_value
 
     def __reduce__(self):
         """
@@ -177,13 +294,13 @@ class HakkaJsonFloat(HakkaJsonBase):
         Returns:
             tuple: The reduction tuple.
         """
-        return (HakkaJsonFloat, (self.to_python(),))
+        return (HakkaJsonFloat._from_float, (self.to_python(),))
 
     def __repr__(self) -> str:
         return f"HakkaJsonFloat({self.to_python()})"
 
     def __str__(self) -> str:
-        return str(self.to_python())
+        return float.__repr__(self.to_python())
 
     def __float__(self) -> float:
         return self.to_python()
@@ -260,23 +377,28 @@ class HakkaJsonFloat(HakkaJsonBase):
         Raises:
             TypeError: If the other operand is of unsupported type.
         """
-        if isinstance(other, HakkaJsonFloat):
+        other_type = type(other)
+        if other_type is float:
+            other_value = other
+        elif other_type is HakkaJsonFloat:
             other_value = other.to_python()
-        elif isinstance(other, (int, float)):
+        elif other_type is int or isinstance(other, (int, float)):
             other_value = float(other)
+        elif isinstance(other, HakkaJsonFloat):
+            other_value = other.to_python()
         else:
             return NotImplemented
         result_value = op(self.to_python(), other_value)
-        return HakkaJsonFloat(result_value)
+        return HakkaJsonFloat._from_float(result_value)
 
     def __add__(self, other) -> "HakkaJsonFloat":
-        return self._arithmetic(other, lambda x, y: x + y)
+        return self._arithmetic(other, add)
 
     def __sub__(self, other) -> "HakkaJsonFloat":
-        return self._arithmetic(other, lambda x, y: x - y)
+        return self._arithmetic(other, sub)
 
     def __mul__(self, other) -> "HakkaJsonFloat":
-        return self._arithmetic(other, lambda x, y: x * y)
+        return self._arithmetic(other, mul)
 
     def __truediv__(self, other) -> float:
         """
@@ -292,10 +414,15 @@ class HakkaJsonFloat(HakkaJsonBase):
             ZeroDivisionError: If dividing by zero.
             TypeError: If the other operand is of unsupported type.
         """
-        if isinstance(other, HakkaJsonFloat):
+        other_type = type(other)
+        if other_type is float:
+            other_value = other
+        elif other_type is HakkaJsonFloat:
             other_value = other.to_python()
-        elif isinstance(other, (int, float)):
+        elif other_type is int or isinstance(other, (int, float)):
             other_value = float(other)
+        elif isinstance(other, HakkaJsonFloat):
+            other_value = other.to_python()
         else:
             return NotImplemented
         if other_value == 0.0:
@@ -303,28 +430,42 @@ class HakkaJsonFloat(HakkaJsonBase):
         return self.to_python() / other_value
 
     def __floordiv__(self, other) -> "HakkaJsonFloat":
-        return self._arithmetic(other, lambda x, y: x // y)
+        return self._arithmetic(other, floordiv)
 
     def __mod__(self, other) -> "HakkaJsonFloat":
-        return self._arithmetic(other, lambda x, y: x % y)
+        return self._arithmetic(other, mod)
 
     def __pow__(self, other, modulo=None) -> "HakkaJsonFloat":
         if modulo is not None:
             if isinstance(other, (HakkaJsonFloat, int, float)):
                 return HakkaJsonFloat(pow(self.to_python(), float(other), modulo))
             return NotImplemented
-        return self._arithmetic(other, lambda x, y: pow(x, y))
+        if type(other) is int or type(other) is float:
+            # Exponents with an exact shortcut; anything else, including a
+            # square that overflows (pow raises there), goes through pow.
+            if other == 2:
+                value = self.to_python()
+                squared = value * value
+                if squared != inf:
+                    return HakkaJsonFloat._from_float(squared)
+            elif other == 1:
+                return self
+            elif other == 0:
+                return HakkaJsonFloat._from_float(1.0)
+        return self._arithmetic(other, pow)
 
     def __radd__(self, other) -> "HakkaJsonFloat":
-        return self._arithmetic(other, lambda x, y: y + x)
+        return self._arithmetic(other, add)
 
     def __rsub__(self, other) -> "HakkaJsonFloat":
-        if isinstance(other, (HakkaJsonFloat, int, float)):
-            return HakkaJsonFloat(float(other) - self.to_python())
+        if type(other) in _NUMBER_TYPES or isinstance(
+            other, (HakkaJsonFloat, int, float)
+        ):
+            return HakkaJsonFloat._from_float(float(other) - self.to_python())
         return NotImplemented
 
     def __rmul__(self, other) -> "HakkaJsonFloat":
-        return self._arithmetic(other, lambda x, y: y * x)
+        return self._arithmetic(other, mul)
 
     def __rtruediv__(self, other) -> float:
         """
@@ -340,7 +481,9 @@ class HakkaJsonFloat(HakkaJsonBase):
             ZeroDivisionError: If dividing by zero.
             TypeError: If the other operand is of unsupported type.
         """
-        if isinstance(other, (HakkaJsonFloat, int, float)):
+        if type(other) in _NUMBER_TYPES or isinstance(
+            other, (HakkaJsonFloat, int, float)
+        ):
             other_value = float(other)
             divisor = self.to_python()
             if divisor == 0.0:
@@ -349,37 +492,43 @@ class HakkaJsonFloat(HakkaJsonBase):
         return NotImplemented
 
     def __rfloordiv__(self, other) -> "HakkaJsonFloat":
-        if isinstance(other, (HakkaJsonFloat, int, float)):
+        if type(other) in _NUMBER_TYPES or isinstance(
+            other, (HakkaJsonFloat, int, float)
+        ):
             other_value = float(other)
             divisor = self.to_python()
             if divisor == 0.0:
                 raise ZeroDivisionError("floordiv by zero")
-            return HakkaJsonFloat(other_value // divisor)
+            return HakkaJsonFloat._from_float(other_value // divisor)
         return NotImplemented
 
     def __rmod__(self, other) -> "HakkaJsonFloat":
-        if isinstance(other, (HakkaJsonFloat, int, float)):
+        if type(other) in _NUMBER_TYPES or isinstance(
+            other, (HakkaJsonFloat, int, float)
+        ):
             other_value = float(other)
             divisor = self.to_python()
             if divisor == 0.0:
                 raise ZeroDivisionError("modulo by zero")
-            return HakkaJsonFloat(other_value % divisor)
+            return HakkaJsonFloat._from_float(other_value % divisor)
         return NotImplemented
 
     def __rpow__(self, other) -> "HakkaJsonFloat":
-        if isinstance(other, (HakkaJsonFloat, int, float)):
-            return HakkaJsonFloat(pow(float(other), self.to_python()))
+        if type(other) in _NUMBER_TYPES or isinstance(
+            other, (HakkaJsonFloat, int, float)
+        ):
+            return HakkaJsonFloat._from_float(pow(float(other), self.to_python()))
         return NotImplemented
 
     # Unary Operations
     def __neg__(self) -> "HakkaJsonFloat":
-        return HakkaJsonFloat(-self.to_python())
+        return HakkaJsonFloat._from_float(-self.to_python())
 
     def __pos__(self) -> "HakkaJsonFloat":
-        return HakkaJsonFloat(+self.to_python())
+        return HakkaJsonFloat._from_float(+self.to_python())
 
     def __abs__(self) -> "HakkaJsonFloat":
-        return HakkaJsonFloat(abs(self.to_python()))
+        return HakkaJsonFloat._from_float(abs(self.to_python()))
 
     def __invert__(self):
         """
@@ -466,7 +615,7 @@ class HakkaJsonFloat(HakkaJsonBase):
         Returns:
             HakkaJsonFloat: The ceiling of the float.
         """
-        return HakkaJsonFloat(ceil(self.to_python()))
+        return HakkaJsonFloat._from_float(float(ceil(self.to_python())))
 
     def __floor__(self) -> "HakkaJsonFloat":
         """
@@ -475,7 +624,7 @@ class HakkaJsonFloat(HakkaJsonBase):
         Returns:
             HakkaJsonFloat: The floor of the float.
         """
-        return HakkaJsonFloat(floor(self.to_python()))
+        return HakkaJsonFloat._from_float(float(floor(self.to_python())))
 
     def __trunc__(self) -> "HakkaJsonFloat":
         """
@@ -484,7 +633,7 @@ class HakkaJsonFloat(HakkaJsonBase):
         Returns:
             HakkaJsonFloat: The truncated value.
         """
-        return HakkaJsonFloat(trunc(self.to_python()))
+        return HakkaJsonFloat._from_float(float(trunc(self.to_python())))
 
     def __round__(self, ndigits=None) -> "HakkaJsonFloat":
         """
@@ -496,7 +645,7 @@ class HakkaJsonFloat(HakkaJsonBase):
         Returns:
             HakkaJsonFloat: The rounded value.
         """
-        return HakkaJsonFloat(round(self.to_python(), ndigits))
+        return HakkaJsonFloat._from_float(float(round(self.to_python(), ndigits)))
 
     # Additional Methods
     def __getnewargs__(self) -> tuple:
@@ -526,13 +675,33 @@ class HakkaJsonFloat(HakkaJsonBase):
         """
         if not isinstance(state, float):
             raise TypeError("State must be a float.")
-        # Release the current handle
-        if self._c_hakka_handle:
-            dispatch_table["HakkaRelease"](byref(self._c_hakka_handle))
+        current = self.to_python()
+        if _SMALL_CACHE.get(current) is self:
+            raise TypeError("Cannot change the state of a shared HakkaJsonFloat.")
+        # Nothing to rebuild if the value is unchanged; the sign check keeps
+        # 0.0 and -0.0 apart.
+        if current == state and copysign(1.0, current) == copysign(1.0, state):
+            return
+        try:
+            handle = _handle_slot.__get__(self, HakkaJsonFloat)
+        except AttributeError:
+            handle = None
+        if handle:
+            # Release the current handle
+            _release_func(handle)
+        else:
+            # A lazy value has no C object yet; create one in a fresh handle.
+            handle = CHakkaHandle()
+            _handle_slot.__set__(self, handle)
         # Create a new handle with the new state
-        result = _create_float_func(byref(self._c_hakka_handle), state)
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        result = _create_float_func(handle, state)
+        if result:
             raise RuntimeError("Failed to set state for HakkaJsonFloat.")
+        object.__setattr__(self, "_cached_value", state)
+        try:
+            object.__delattr__(self, "_cached_hash")
+        except AttributeError:
+            pass
 
     def __sizeof__(self) -> int:
         """
@@ -554,7 +723,7 @@ class HakkaJsonFloat(HakkaJsonBase):
         Raises:
             AttributeError: If attempting to set any attribute.
         """
-        if name in self.__slots__:
+        if name in _IMMUTABLE_NAMES:
             raise AttributeError("HakkaJsonFloat objects are immutable")
         super().__setattr__(name, value)
 
@@ -568,7 +737,7 @@ class HakkaJsonFloat(HakkaJsonBase):
         Returns:
             str: The formatted string.
         """
-        return format(self.to_python(), format_spec)
+        return float.__format__(self.to_python(), format_spec)
 
     def __getformat__(self, format_type: str) -> str:
         """
@@ -587,67 +756,77 @@ class HakkaJsonFloat(HakkaJsonBase):
             return "native"
         raise TypeError(f"unsupported format type {format_type!r}")
 
-    def __dir__(self):
-        return super().__dir__() + [
-            "_construct",
-            "__init__",
-            "__bool__",
-            "to_python",
-            "from_python",
-            "_compare",
-            "__eq__",
-            "__ge__",
-            "__gt__",
-            "__le__",
-            "__lt__",
-            "__ne__",
-            "__hash__",
-            "__reduce__",
-            "__repr__",
-            "__str__",
-            "__float__",
-            "__int__",
-            "__set__",
-            "__copy__",
-            "__deepcopy__",
-            "__getitem__",
-            "__len__",
-            "_arithmetic",
-            "__add__",
-            "__sub__",
-            "__mul__",
-            "__truediv__",
-            "__floordiv__",
-            "__mod__",
-            "__pow__",
-            "__radd__",
-            "__rsub__",
-            "__rmul__",
-            "__rtruediv__",
-            "__rfloordiv__",
-            "__rmod__",
-            "__rpow__",
-            "__neg__",
-            "__pos__",
-            "__abs__",
-            "__invert__",
-            "conjugate",
-            "is_integer",
-            "as_integer_ratio",
-            "fromhex",
-            "hex",
-            "real",
-            "imag",
-            "__ceil__",
-            "__floor__",
-            "__trunc__",
-            "__round__",
-            "__getnewargs__",
-            "__getstate__",
-            "__setstate__",
-            "__sizeof__",
-            "__setattr__",
-            "__format__",
-            "__getformat__",
-            "__dir__",
-        ]
+    _DIR = HakkaJsonBase._DIR + (
+        "_construct",
+        "__init__",
+        "_from_float",
+        "_c_hakka_handle",
+        "__del__",
+        "__bool__",
+        "to_python",
+        "from_python",
+        "_compare",
+        "__eq__",
+        "__ge__",
+        "__gt__",
+        "__le__",
+        "__lt__",
+        "__ne__",
+        "__hash__",
+        "__reduce__",
+        "__repr__",
+        "__str__",
+        "__float__",
+        "__int__",
+        "__set__",
+        "__copy__",
+        "__deepcopy__",
+        "__getitem__",
+        "__len__",
+        "_arithmetic",
+        "__add__",
+        "__sub__",
+        "__mul__",
+        "__truediv__",
+        "__floordiv__",
+        "__mod__",
+        "__pow__",
+        "__radd__",
+        "__rsub__",
+        "__rmul__",
+        "__rtruediv__",
+        "__rfloordiv__",
+        "__rmod__",
+        "__rpow__",
+        "__neg__",
+        "__pos__",
+        "__abs__",
+        "__invert__",
+        "conjugate",
+        "is_integer",
+        "as_integer_ratio",
+        "fromhex",
+        "hex",
+        "real",
+        "imag",
+        "__ceil__",
+        "__floor__",
+        "__trunc__",
+        "__round__",
+        "__getnewargs__",
+        "__getstate__",
+        "__setstate__",
+        "__sizeof__",
+        "__setattr__",
+        "__format__",
+        "__getformat__",
+        "__dir__",
+    )
+
+
+# Slots that __setattr__ refuses to overwrite.
+_IMMUTABLE_NAMES = frozenset(HakkaJsonFloat.__slots__)
+
+_SMALL_CACHE.update(
+    (value, HakkaJsonFloat(value)) for value in (0.0, 1.0, -1.0, inf, -inf)
+)
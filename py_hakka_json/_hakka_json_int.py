@@ -2,17 +2,61 @@
 HakkaJsonInt class definition.
 """
 
-from ctypes import byref, c_int64, c_int32, c_uint64
+import threading
+from ctypes import c_int64
+from operator import (
+    add,
+    and_,
+    eq,
+    floordiv,
+    ge,
+    gt,
+    le,
+    lshift,
+    lt,
+    mod,
+    mul,
+    ne,
+    or_,
+    rshift,
+    sub,
+    xor,
+)
 from ._hakka_json_base import HakkaJsonBase
 from ._hakka_json_loader import CHakkaHandle, dispatch_table
-from ._hakka_json_enum import HakkaJsonResultEnum, HakkaJsonTypeEnum
+from ._hakka_json_enum import HakkaJsonTypeEnum
 
 __all__ = ["HakkaJsonInt"]
 
 _create_int_func = dispatch_table["CreateHakkaInt"]
 _get_int_func = dispatch_table["GetHakkaInt"]
-_compare_func = dispatch_table["HakkaCompare"]
-_hash_func = dispatch_table["HakkaHash"]
+_release_func = dispatch_table["HakkaRelease"]
+
+
+class _Scratch(threading.local):
+    """
+    Per-thread out-parameters for C calls whose result is read back right away.
+
+    Handles are not pooled here: each HakkaJsonInt owns its CHakkaHandle.
+    """
+
+    def __init__(self):
+        self.i64 = c_int64()
+
+
+_scratch = _Scratch()
+
+# Range CreateHakkaInt can store. ctypes wraps larger values silently
+# instead of raising, so _construct has to check them itself.
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+# Range of the shared instances built at the end of this module, matching
+# CPython's own small-int cache. Only _from_int hands them out, so objects
+# built with HakkaJsonInt(value) stay distinct and __setstate__ can't touch
+# a shared one.
+_SMALL_INT_MIN = -5
+_SMALL_INT_MAX = 256
 
 
 class HakkaJsonInt(HakkaJsonBase):
@@ -20,7 +64,8 @@ class HakkaJsonInt(HakkaJsonBase):
     Represents a JSON integer value in HakkaJson.
     """
 
-    __slots__ = ()
+    # The Python value, recorded at construction since the object is immutable.
+    __slots__ = ("_cached_int",)
 
     @staticmethod
     def _construct(value: int) -> CHakkaHandle:
@@ -33,11 +78,11 @@ class HakkaJsonInt(HakkaJsonBase):
         Returns:
             CHakkaHandle: The handle to the HakkaJsonInt object.
         """
-        if value > 9223372036854775807 or value < -9223372036854775808:
+        if not _INT64_MIN <= value <= _INT64_MAX:
             raise OverflowError("Integer value out of range.")
         c_hakka_handle = CHakkaHandle()
-        result = _create_int_func(byref(c_hakka_handle), value)
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        result = _create_int_func(c_hakka_handle, value)
+        if result:
             raise RuntimeError("Failed to create HakkaJsonInt.")
         return c_hakka_handle
 
@@ -49,22 +94,46 @@ class HakkaJsonInt(HakkaJsonBase):
             value (int or HakkaJsonBase or HakkaJsonInt): The value to initialize.
         """
         if isinstance(value, HakkaJsonInt):
-            self._c_hakka_handle = HakkaJsonInt._construct(value.to_python())
+            py_value = value.to_python()
         elif isinstance(value, int):
-            self._c_hakka_handle = HakkaJsonInt._construct(value)
+            py_value = int(value)
         elif isinstance(value, HakkaJsonBase):
             if value.get_type() != HakkaJsonTypeEnum.HAKKA_JSON_INT:
                 raise TypeError("Unsupported type for HakkaJsonInt initialization.")
-            out_int = c_int64()
-            result = _get_int_func(value._c_hakka_handle, byref(out_int))
-            if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+            out_int = _scratch.i64
+            result = _get_int_func(value._c_hakka_handle, out_int)
+            if result:
                 raise RuntimeError(
                     "Failed to retrieve integer value from HakkaJsonInt."
                 )
-            self._c_hakka_handle = HakkaJsonInt._construct(out_int.value)
+            py_value = out_int.value
         else:
             raise TypeError("Unsupported type for HakkaJsonInt initialization.")
-        super().__init__(self._c_hakka_handle)
+        object.__setattr__(self, "_c_hakka_handle", HakkaJsonInt._construct(py_value))
+        object.__setattr__(self, "_cached_int", py_value)
+
+    @classmethod
+    def _from_int(cls, value) -> "HakkaJsonInt":
+        """
+        Wrap the result of a Python-side operation.
+
+        An exact int comes from the small-int pool or goes straight to
+        _construct; anything else goes through the regular constructor.
+
+        Args:
+            value: The result value.
+
+        Returns:
+            HakkaJsonInt: The wrapped value.
+        """
+        if type(value) is not int:
+            return cls(value)
+        if _SMALL_INT_MIN <= value <= _SMALL_INT_MAX:
+            return _SMALL_INTS[value - _SMALL_INT_MIN]
+        instance = HakkaJsonBase.__new__(cls)
+        object.__setattr__(instance, "_c_hakka_handle", cls._construct(value))
+        object.__setattr__(instance, "_cached_int", value)
+        return instance
 
     def __bool__(self) -> bool:
         """
@@ -82,11 +151,17 @@ class HakkaJsonInt(HakkaJsonBase):
         Returns:
             int: The integer value.
         """
-        out_int = c_int64()
-        result = _get_int_func(self._c_hakka_handle, byref(out_int))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        try:
+            return self._cached_int
+        except AttributeError:
+            pass
+        out_int = _scratch.i64
+        result = _get_int_func(self._c_hakka_handle, out_int)
+        if result:
             raise RuntimeError("Failed to retrieve integer value from HakkaJsonInt.")
-        return out_int.value
+        value = out_int.value
+        object.__setattr__(self, "_cached_int", value)
+        return value
 
     @staticmethod
     def from_python(value: int) -> "HakkaJsonInt":
@@ -101,6 +176,24 @@ class HakkaJsonInt(HakkaJsonBase):
         """
         return HakkaJsonInt(value)
 
+    @classmethod
+    def from_iterable(cls, values) -> list:
+        """
+        Create a list of HakkaJsonInt objects from an iterable of integers.
+
+        The C library has no bulk constructor, so this still makes one
+        CreateHakkaInt call per value. Values in the small-int range are
+        taken from the shared pool and make no call at all.
+
+        Args:
+            values: An iterable of integers or HakkaJsonInt objects.
+
+        Returns:
+            list: The HakkaJsonInt objects, in input order.
+        """
+        from_int = cls._from_int
+        return [from_int(value) for value in values]
+
     def _compare(self, other, op) -> bool:
         """
         Compare this HakkaJsonInt with another value using a comparison operation.
@@ -112,43 +205,36 @@ class HakkaJsonInt(HakkaJsonBase):
         Returns:
             bool: The result of the comparison.
         """
-        if isinstance(other, HakkaJsonInt):
-            other_handle = other._c_hakka_handle
+        # Both values are cached Python ints, so the comparison needs no C
+        # call and no temporary handle for a plain int operand.
+        other_type = type(other)
+        if other_type is int:
+            other_value = other
+        elif other_type is HakkaJsonInt or isinstance(other, HakkaJsonInt):
+            other_value = other.to_python()
         elif isinstance(other, int):
-            other_handle = CHakkaHandle()
-            result = _create_int_func(byref(other_handle), other)
-            if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-                raise RuntimeError(
-                    "Failed to create temporary HakkaJsonInt for comparison."
-                )
+            other_value = other
         else:
             return NotImplemented
-
-        comparison_result = c_int32()
-        result = _compare_func(
-            self._c_hakka_handle, other_handle, byref(comparison_result)
-        )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError("Comparison failed.")
-        return op(comparison_result.value, 0)
+        return op(self.to_python(), other_value)
 
     def __eq__(self, other) -> bool:
-        return self._compare(other, lambda x, y: x == y)
+        return self._compare(other, eq)
 
     def __ge__(self, other) -> bool:
-        return self._compare(other, lambda x, y: x >= y)
+        return self._compare(other, ge)
 
     def __gt__(self, other) -> bool:
-        return self._compare(other, lambda x, y: x > y)
+        return self._compare(other, gt)
 
     def __le__(self, other) -> bool:
-        return self._compare(other, lambda x, y: x <= y)
+        return self._compare(other, le)
 
     def __lt__(self, other) -> bool:
-        return self._compare(other, lambda x, y: x < y)
+        return self._compare(other, lt)
 
     def __ne__(self, other) -> bool:
-        return self._compare(other, lambda x, y: x != y)
+        return self._compare(other, ne)
 
     def __hash__(self) -> int:
         """
@@ -157,11 +243,9 @@ class HakkaJsonInt(HakkaJsonBase):
         Returns:
             int: The hash value.
         """
-        hash_value = c_uint64()
-        result = _hash_func(self._c_hakka_handle, byref(hash_value))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError("Failed to compute hash for HakkaJsonInt.")
-        return hash_value.value
+        # Hash the cached Python value, so a HakkaJsonInt that compares
+        # equal to an int also hashes like it.
+        return hash(self.to_python())
 
     def __reduce__(self):
         """
@@ -204,7 +288,7 @@ class HakkaJsonInt(HakkaJsonBase):
         Returns:
             HakkaJsonInt: The copied object.
         """
-        return HakkaJsonInt(self.to_python())
+        return HakkaJsonInt._from_int(self.to_python())
 
     def __getitem__(self, key):
         """
@@ -241,19 +325,25 @@ class HakkaJsonInt(HakkaJsonBase):
         Raises:
             TypeError: If the other operand is of unsupported type.
         """
-        if not isinstance(other, (HakkaJsonInt, int)):
+        other_type = type(other)
+        if other_type is int:
+            other_value = other
+        elif other_type is HakkaJsonInt or isinstance(other, HakkaJsonInt):
+            other_value = other.to_python()
+        elif isinstance(other, int):
+            other_value = other
+        else:
             return NotImplemented
-        other_value = other.to_python() if isinstance(other, HakkaJsonInt) else other
-        return HakkaJsonInt(op(self.to_python(), other_value))
+        return HakkaJsonInt._from_int(op(self.to_python(), other_value))
 
     def __add__(self, other) -> "HakkaJsonInt":
-        return self._arithmetic(other, lambda x, y: x + y)
+        return self._arithmetic(other, add)
 
     def __sub__(self, other) -> "HakkaJsonInt":
-        return self._arithmetic(other, lambda x, y: x - y)
+        return self._arithmetic(other, sub)
 
     def __mul__(self, other) -> "HakkaJsonInt":
-        return self._arithmetic(other, lambda x, y: x * y)
+        return self._arithmetic(other, mul)
 
     def __truediv__(self, other) -> float:
         """
@@ -276,28 +366,35 @@ class HakkaJsonInt(HakkaJsonBase):
         return self.to_python() / other_value
 
     def __floordiv__(self, other) -> "HakkaJsonInt":
-        return self._arithmetic(other, lambda x, y: x // y)
+        return self._arithmetic(other, floordiv)
 
     def __mod__(self, other) -> "HakkaJsonInt":
-        return self._arithmetic(other, lambda x, y: x % y)
+        return self._arithmetic(other, mod)
 
     def __pow__(self, other, modulo=None) -> "HakkaJsonInt":
-        if modulo is not None:
-            if isinstance(other, (HakkaJsonInt, int)):
-                return HakkaJsonInt(pow(self.to_python(), int(other), modulo))
+        other_type = type(other)
+        if other_type is int:
+            exponent = other
+        elif other_type is HakkaJsonInt or isinstance(other, HakkaJsonInt):
+            exponent = other.to_python()
+        elif isinstance(other, int):
+            exponent = other
+        else:
             return NotImplemented
-        return self._arithmetic(other, lambda x, y: pow(x, y))
+        if modulo is None:
+            return HakkaJsonInt._from_int(self.to_python() ** exponent)
+        return HakkaJsonInt._from_int(pow(self.to_python(), exponent, modulo))
 
     def __radd__(self, other) -> "HakkaJsonInt":
-        return self._arithmetic(other, lambda x, y: y + x)
+        return self._arithmetic(other, add)
 
     def __rsub__(self, other) -> "HakkaJsonInt":
         if isinstance(other, (HakkaJsonInt, int)):
-            return HakkaJsonInt(int(other) - self.to_python())
+            return HakkaJsonInt._from_int(int(other) - self.to_python())
         return NotImplemented
 
     def __rmul__(self, other) -> "HakkaJsonInt":
-        return self._arithmetic(other, lambda x, y: y * x)
+        return self._arithmetic(other, mul)
 
     def __rtruediv__(self, other) -> float:
         """
@@ -321,7 +418,7 @@ class HakkaJsonInt(HakkaJsonBase):
             other_value = int(other)
             if self.to_python() == 0:
                 raise ZeroDivisionError("floordiv by zero")
-            return HakkaJsonInt(other_value // self.to_python())
+            return HakkaJsonInt._from_int(other_value // self.to_python())
         return NotImplemented
 
     def __rmod__(self, other) -> "HakkaJsonInt":
@@ -329,49 +426,49 @@ class HakkaJsonInt(HakkaJsonBase):
             other_value = int(other)
             if self.to_python() == 0:
                 raise ZeroDivisionError("modulo by zero")
-            return HakkaJsonInt(other_value % self.to_python())
+            return HakkaJsonInt._from_int(other_value % self.to_python())
         return NotImplemented
 
     def __rpow__(self, other) -> "HakkaJsonInt":
         if isinstance(other, (HakkaJsonInt, int)):
-            return HakkaJsonInt(pow(int(other), self.to_python()))
+            return HakkaJsonInt._from_int(pow(int(other), self.to_python()))
         return NotImplemented
 
     def __neg__(self) -> "HakkaJsonInt":
-        return HakkaJsonInt(-self.to_python())
+        return HakkaJsonInt._from_int(-self.to_python())
 
     def __pos__(self) -> "HakkaJsonInt":
-        return HakkaJsonInt(+self.to_python())
+        return HakkaJsonInt._from_int(+self.to_python())
 
     def __abs__(self) -> "HakkaJsonInt":
-        return HakkaJsonInt(abs(self.to_python()))
+        return HakkaJsonInt._from_int(abs(self.to_python()))
 
     def __invert__(self) -> "HakkaJsonInt":
-        return HakkaJsonInt(~self.to_python())
+        return HakkaJsonInt._from_int(~self.to_python())
 
     def __lshift__(self, other) -> "HakkaJsonInt":
-        return self._arithmetic(other, lambda x, y: x << y)
+        return self._arithmetic(other, lshift)
 
     def __rshift__(self, other) -> "HakkaJsonInt":
-        return self._arithmetic(other, lambda x, y: x >> y)
+        return self._arithmetic(other, rshift)
 
     def __and__(self, other) -> "HakkaJsonInt":
-        return self._arithmetic(other, lambda x, y: x & y)
+        return self._arithmetic(other, and_)
 
     def __or__(self, other) -> "HakkaJsonInt":
-        return self._arithmetic(other, lambda x, y: x | y)
+        return self._arithmetic(other, or_)
 
     def __xor__(self, other) -> "HakkaJsonInt":
-        return self._arithmetic(other, lambda x, y: x ^ y)
+        return self._arithmetic(other, xor)
 
     def __rand__(self, other) -> "HakkaJsonInt":
-        return self._arithmetic(other, lambda x, y: y & x)
+        return self._arithmetic(other, and_)
 
     def __ror__(self, other) -> "HakkaJsonInt":
-        return self._arithmetic(other, lambda x, y: y | x)
+        return self._arithmetic(other, or_)
 
     def __rxor__(self, other) -> "HakkaJsonInt":
-        return self._arithmetic(other, lambda x, y: y ^ x)
+        return self._arithmetic(other, xor)
 
     def bit_length(self) -> int:
         """
@@ -414,7 +511,7 @@ class HakkaJsonInt(HakkaJsonBase):
             HakkaJsonInt: The resulting integer.
         """
         value = int.from_bytes(source_bytes, byteorder, signed=signed)
-        return HakkaJsonInt(value)
+        return HakkaJsonInt._from_int(value)
 
     @property
     def imag(self):
@@ -515,8 +612,8 @@ class HakkaJsonInt(HakkaJsonBase):
             HakkaJsonInt: The rounded integer.
         """
         if ndigits is not None:
-            return HakkaJsonInt(round(self.to_python(), ndigits))
-        return HakkaJsonInt(round(self.to_python()))
+            return HakkaJsonInt._from_int(round(self.to_python(), ndigits))
+        return HakkaJsonInt._from_int(round(self.to_python()))
 
     def __trunc__(self) -> "HakkaJsonInt":
         """
@@ -554,13 +651,19 @@ class HakkaJsonInt(HakkaJsonBase):
         """
         if not isinstance(state, int):
             raise TypeError("State must be an integer.")
-        # Release the current handle
+        value = self.to_python()
+        if (
+            _SMALL_INT_MIN <= value <= _SMALL_INT_MAX
+            and _SMALL_INTS[value - _SMALL_INT_MIN] is self
+        ):
+            raise TypeError("Cannot change the state of a shared HakkaJsonInt.")
+        # Build the new handle first so an out-of-range state leaves the
+        # object untouched.
+        new_handle = HakkaJsonInt._construct(int(state))
         if self._c_hakka_handle:
-            dispatch_table["HakkaRelease"](byref(self._c_hakka_handle))
-        # Create a new handle with the new state
-        result = _create_int_func(byref(self._c_hakka_handle), state)
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError("Failed to set state for HakkaJsonInt.")
+            _release_func(self._c_hakka_handle)
+        object.__setattr__(self, "_c_hakka_handle", new_handle)
+        object.__setattr__(self, "_cached_int", int(state))
 
     def __sizeof__(self) -> int:
         """
@@ -582,80 +685,90 @@ class HakkaJsonInt(HakkaJsonBase):
         Raises:
             AttributeError: Always, since objects are immutable.
         """
-        if name in self.__slots__:
+        if name in _IMMUTABLE_NAMES:
             raise AttributeError("HakkaJsonInt objects are immutable")
         super().__setattr__(name, value)
 
-    def __dir__(self):
-        return super().__dir__() + [
-            "_construct",
-            "__init__",
-            "__bool__",
-            "to_python",
-            "from_python",
-            "_compare",
-            "__eq__",
-            "__ge__",
-            "__gt__",
-            "__le__",
-            "__lt__",
-            "__ne__",
-            "__hash__",
-            "__reduce__",
-            "__repr__",
-            "__str__",
-            "__int__",
-            "__float__",
-            "__set__",
-            "__copy__",
-            "__getitem__",
-            "__len__",
-            "_arithmetic",
-            "__add__",
-            "__sub__",
-            "__mul__",
-            "__truediv__",
-            "__floordiv__",
-            "__mod__",
-            "__pow__",
-            "__radd__",
-            "__rsub__",
-            "__rmul__",
-            "__rtruediv__",
-            "__rfloordiv__",
-            "__rmod__",
-            "__rpow__",
-            "__neg__",
-            "__pos__",
-            "__abs__",
-            "__invert__",
-            "__lshift__",
-            "__rshift__",
-            "__and__",
-            "__or__",
-            "__xor__",
-            "__rand__",
-            "__ror__",
-            "__rxor__",
-            "bit_length",
-            "conjugate",
-            "denominator",
-            "from_bytes",
-            "imag",
-            "real",
-            "is_integer",
-            "numerator",
-            "to_bytes",
-            "__index__",
-            "as_integer_ratio",
-            "__ceil__",
-            "__floor__",
-            "__round__",
-            "__trunc__",
-            "__getnewargs__",
-            "__getstate__",
-            "__setstate__",
-            "__sizeof__",
-            "___setattr__",
-            "__dir__",
-        ]
+    _DIR = HakkaJsonBase._DIR + (
+        "_construct",
+        "__init__",
+        "_from_int",
+        "__bool__",
+        "to_python",
+        "from_python",
+        "from_iterable",
+        "_compare",
+        "__eq__",
+        "__ge__",
+        "__gt__",
+        "__le__",
+        "__lt__",
+        "__ne__",
+        "__hash__",
+        "__reduce__",
+        "__repr__",
+        "__str__",
+        "__int__",
+        "__float__",
+        "__set__",
+        "__copy__",
+        "__getitem__",
+        "__len__",
+        "_arithmetic",
+        "__add__",
+        "__sub__",
+        "__mul__",
+        "__truediv__",
+        "__floordiv__",
+        "__mod__",
+        "__pow__",
+        "__radd__",
+        "__rsub__",
+        "__rmul__",
+        "__rtruediv__",
+        "__rfloordiv__",
+        "__rmod__",
+        "__rpow__",
+        "__neg__",
+        "__pos__",
+        "__abs__",
+        "__invert__",
+        "__lshift__",
+        "__rshift__",
+        "__and__",
+        "__or__",
+        "__xor__",
+        "__rand__",
+        "__ror__",
+        "__rxor__",
+        "bit_length",
+        "conjugate",
+        "denominator",
+        "from_bytes",
+        "imag",
+        "real",
+        "is_integer",
+        "numerator",
+        "to_bytes",
+        "__index__",
+        "as_integer_ratio",
+        "__ceil__",
+        "__floor__",
+        "__round__",
+        "__trunc__",
+        "__getnewargs__",
+        "__getstate__",
+        "__setstate__",
+        "__sizeof__",
+        "__setattr__",
+        "__dir__",
+    )
+
+
+# Slots that __setattr__ refuses to overwrite.
+_IMMUTABLE_NAMES = frozenset(HakkaJsonInt.__slots__)
+
+
+_SMALL_INTS = tuple(
+    HakkaJsonInt(value) for value in range(_SMALL_INT_MIN, _SMALL_INT_MAX + 1)
+)
@@ -7,11 +7,8 @@ Represents an invalid JSON value in HakkaJson.
 Implements singleton pattern for efficiency.
 """
 
-from ctypes import byref
-
 from ._hakka_json_base import HakkaJsonBase
 from ._hakka_json_loader import CHakkaHandle, dispatch_table
-from ._hakka_json_enum import HakkaJsonResultEnum
 
 
 __all__ = ["HakkaJsonInvalid"]
@@ -27,30 +24,24 @@ class HakkaJsonInvalid(HakkaJsonBase):
     Implements singleton pattern.
     """
 
-    __slots__ = ("_initialized",)
+    __slots__ = ()
 
-    _instance = None  # Class attribute to hold the singleton instance
+    _instance = None  # The singleton, created once at the end of this module
+    _HASH = hash("HakkaJsonInvalid")  # Fixed hash shared by all instances
 
     def __new__(cls):
         """
-        Ensure that only one instance exists for HakkaJsonInvalid.
+        Return the singleton instance of HakkaJsonInvalid.
         """
-        if cls._instance is None:
-            instance = super(HakkaJsonInvalid, cls).__new__(cls)
-            cls._instance = instance
         return cls._instance
 
-    def __init__(self):
+    def __init__(self):  # pylint: disable=super-init-not-called
         """
-        Initialize the HakkaJsonInvalid object.
+        Initialize the HakkaJsonInvalid object; the singleton is set up at import.
+
+        HakkaJsonBase.__init__ must not run again, as it would replace the
+        singleton's handle with an empty one.
         """
-        if not hasattr(self, "_initialized"):
-            c_hakka_handle = CHakkaHandle()
-            result = _create_invalid_func(byref(c_hakka_handle))
-            if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-                raise RuntimeError("Failed to create HakkaJsonInvalid.")
-            super().__init__(c_hakka_handle)
-            self._initialized = True
 
     def __bool__(self) -> bool:
         """
@@ -76,15 +67,16 @@ class HakkaJsonInvalid(HakkaJsonBase):
         """
         Equality comparison for HakkaJsonInvalid.
         """
-        # Only equal to another HakkaJsonInvalid instance
-        return isinstance(other, HakkaJsonInvalid)
+        # Only equal to another HakkaJsonInvalid instance, normally the singleton
+        return other is HakkaJsonInvalid._instance or isinstance(
+            other, HakkaJsonInvalid
+        )
 
     def __hash__(self) -> int:
         """
         Get the hash of the HakkaJsonInvalid object.
         """
-        # Fixed hash for singleton
-        return hash("HakkaJsonInvalid")
+        return HakkaJsonInvalid._HASH
 
     def __reduce__(self):
         """
@@ -110,19 +102,34 @@ class HakkaJsonInvalid(HakkaJsonBase):
         """
         return self.to_python()
 
-    def __dir__(self):
-        return super().__dir__() + [
-            "__new__",
-            "__init__",
-            "__bool__",
-            "to_python",
-            "from_python",
-            "__eq__",
-            "__hash__",
-            "__reduce__",
-            "__repr__",
-            "__str__",
-            "__getnewargs__",
-            "__getstate__",
-            "__dir__",
-        ]
+    _DIR = HakkaJsonBase._DIR + (
+        "__new__",
+        "__init__",
+        "__bool__",
+        "to_python",
+        "from_python",
+        "__eq__",
+        "__hash__",
+        "__reduce__",
+        "__repr__",
+        "__str__",
+        "__getnewargs__",
+        "__getstate__",
+        "__dir__",
+    )
+
+
+def _create_singleton() -> HakkaJsonInvalid:
+    """
+    Create the HakkaJsonInvalid singleton; called once, at import.
+    """
+    c_hakka_handle = CHakkaHandle()
+    result = _create_invalid_func(c_hakka_handle)
+    if result:
+        raise RuntimeError("Failed to create HakkaJsonInvalid.")
+    instance = HakkaJsonBase.__new__(HakkaJsonInvalid)
+    HakkaJsonBase.__init__(instance, c_hakka_handle)
+    return instance
+
+
+HakkaJsonInvalid._instance = _create_singleton()
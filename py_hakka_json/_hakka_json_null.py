@@ -7,11 +7,10 @@ Represents a JSON null value in HakkaJson.
 Implements singleton pattern for efficiency.
 """
 
-from ctypes import byref, c_int32, c_uint64
+from ctypes import c_int32, c_uint64
 
 from ._hakka_json_base import HakkaJsonBase
 from ._hakka_json_loader import CHakkaHandle, dispatch_table
-from ._hakka_json_enum import HakkaJsonResultEnum
 
 
 __all__ = ["HakkaJsonNull"]
@@ -48,8 +47,8 @@ class HakkaJsonNull(HakkaJsonBase):
         """
         if not hasattr(self, "_initialized"):
             c_hakka_handle = CHakkaHandle()
-            result = _create_null_func(byref(c_hakka_handle))
-            if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+            result = _create_null_func(c_hakka_handle)
+            if result:
                 raise RuntimeError("Failed to create HakkaJsonNull.")
             super().__init__(c_hakka_handle)
             self._initialized = True
@@ -95,10 +94,8 @@ class HakkaJsonNull(HakkaJsonBase):
             return NotImplemented
 
         comparison_result = c_int32()
-        result = _compare_func(
-            self._c_hakka_handle, other_handle, byref(comparison_result)
-        )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        result = _compare_func(self._c_hakka_handle, other_handle, comparison_result)
+        if result:
             raise RuntimeError("Comparison failed.")
         return op(comparison_result.value, 0)
 
@@ -126,8 +123,8 @@ class HakkaJsonNull(HakkaJsonBase):
         Typically, hash(None) is used.
         """
         hash_value = c_uint64()
-        result = _hash_func(self._c_hakka_handle, byref(hash_value))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        result = _hash_func(self._c_hakka_handle, hash_value)
+        if result:
             raise RuntimeError("Failed to compute hash for HakkaJsonNull.")
         return hash_value.value
     
@@ -161,25 +158,24 @@ class HakkaJsonNull(HakkaJsonBase):
         """
         return self.to_python()
 
-    def __dir__(self):
-        return super().__dir__() + [
-            "__new__",
-            "__init__",
-            "__bool__",
-            "to_python",
-            "from_python",
-            "_compare",
-            "__eq__",
-            "__ge__",
-            "__gt__",
-            "__le__",
-            "__lt__",
-            "__ne__",
-            "__hash__",
-            "__reduce__",
-            "__repr__",
-            "__str__",
-            "__getnewargs__",
-            "__getstate__",
-            "__dir__",
-        ]
+    _DIR = HakkaJsonBase._DIR + (
+        "__new__",
+        "__init__",
+        "__bool__",
+        "to_python",
+        "from_python",
+        "_compare",
+        "__eq__",
+        "__ge__",
+        "__gt__",
+        "__le__",
+        "__lt__",
+        "__ne__",
+        "__hash__",
+        "__reduce__",
+        "__repr__",
+        "__str__",
+        "__getnewargs__",
+        "__getstate__",
+        "__dir__",
+    )
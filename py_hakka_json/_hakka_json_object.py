@@ -4,12 +4,12 @@ Represents a JSON object value in HakkaJson.
 Implements dict-like behavior.
 """
 
-from ctypes import byref, c_uint32, c_uint8, c_int32, c_uint64
+from ctypes import c_uint32, c_uint8, c_int32, c_uint64
 from typing import Any, Iterable, Optional, Tuple, Union
 
-from ._hakka_json_base import HakkaJsonBase
+from ._hakka_json_base import BufferAllocator, HakkaJsonBase, json_input_buffer
 from ._hakka_json_loader import CHakkaHandle, CHakkaObjectIter, dispatch_table
-from ._hakka_json_enum import HakkaJsonResultEnum, HakkaJsonTypeEnum
+from ._hakka_json_enum import HakkaJsonResultEnum, HakkaJsonTypeEnum, result_name
 from ._hakka_json_type_dispatcher import obj_from_python, handle_to_object
 
 __all__ = ["HakkaJsonObject", "HakkaJsonObjectIterator"]
@@ -38,6 +38,14 @@ _move_object_iter_next_func = dispatch_table["MoveHakkaObjectIterNext"]
 _get_object_iter_deref_func = dispatch_table["GetHakkaObjectIterDeref"]
 _release_object_iter_func = dispatch_table["HakkaObjectIterRelease"]
 
+# Raw result codes the object bindings are checked against (restype c_int).
+_PARSE_ERROR = HakkaJsonResultEnum.HAKKA_JSON_PARSE_ERROR.value
+_RECURSION_DEPTH_EXCEEDED = (
+    HakkaJsonResultEnum.HAKKA_JSON_RECURSION_DEPTH_EXCEEDED.value
+)
+_KEY_NOT_FOUND = HakkaJsonResultEnum.HAKKA_JSON_KEY_NOT_FOUND.value
+_ITERATOR_END = HakkaJsonResultEnum.HAKKA_JSON_ITERATOR_END.value
+
 
 class HakkaJsonObject(HakkaJsonBase):
     """
@@ -58,11 +66,8 @@ class HakkaJsonObject(HakkaJsonBase):
         elif initial is None:
             self._c_hakka_handle = self._construct()
         elif isinstance(initial, dict):
-            new_dict = HakkaJsonObject()
-            for key, value in initial.items():
-                new_dict[key] = value
-            self._c_hakka_handle = new_dict._c_hakka_handle
-            new_dict._c_hakka_handle = None  # move from dict to Object
+            self._c_hakka_handle = self._construct()
+            self._set_items(initial)
         else:
             raise TypeError("Unsupported type for HakkaJsonObject initialization.")
         super().__init__(self._c_hakka_handle)
@@ -73,7 +78,8 @@ class HakkaJsonObject(HakkaJsonBase):
         Deserialize a JSON string into a HakkaJsonObject.
 
         Args:
-            json_str (str): The JSON string to deserialize.
+            json_str (str | bytes | bytearray | memoryview): The JSON string to
+                deserialize, or its UTF-8 encoded bytes.
             max_depth (int, optional): Maximum recursion depth for deserialization.
 
         Returns:
@@ -85,58 +91,57 @@ class HakkaJsonObject(HakkaJsonBase):
             RecursionError: If the recursion depth is exceeded.
             RuntimeError: If deserialization fails.
         """
-        if not isinstance(json_str, (str, bytes)):
+        if not isinstance(json_str, (str, bytes, bytearray, memoryview)):
             raise TypeError("loads() expects a string or UTF-8 bytes.")
-        if isinstance(json_str, str):
-            json_str = json_str.encode("utf-8")
-        buffer_size = c_uint32(len(json_str))
-        buffer = (c_uint8 * buffer_size.value).from_buffer_copy(json_str)
+        json_buffer = json_input_buffer(json_str)
         c_hakka_handle = CHakkaHandle()
         result = _loads_object_func(
-            buffer, buffer_size, byref(c_hakka_handle), c_uint32(max_depth)
+            json_buffer, len(json_buffer), c_hakka_handle, max_depth
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        if result:
             HakkaJsonObject._handle_load_error(result)
         return HakkaJsonObject(HakkaJsonBase(c_hakka_handle))
 
     @staticmethod
     def _construct() -> CHakkaHandle:
         c_hakka_handle = CHakkaHandle()
-        result = _create_object_func(byref(c_hakka_handle))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to create HakkaJsonObject: {result.name}.")
+        result = _create_object_func(c_hakka_handle)
+        if result:
+            raise RuntimeError(
+                f"Failed to create HakkaJsonObject: {result_name(result)}."
+            )
         return c_hakka_handle
 
     @staticmethod
     def _handle_load_error(result):
-        if result == HakkaJsonResultEnum.HAKKA_JSON_PARSE_ERROR:
+        if result == _PARSE_ERROR:
             raise ValueError("Invalid JSON string for HakkaJsonObject.")
-        elif result == HakkaJsonResultEnum.HAKKA_JSON_RECURSION_DEPTH_EXCEEDED:
+        elif result == _RECURSION_DEPTH_EXCEEDED:
             raise RecursionError("Recursion depth exceeded in HakkaJsonObject.")
         else:
-            raise RuntimeError(f"Failed to load HakkaJsonObject: {result.name}.")
+            raise RuntimeError(
+                f"Failed to load HakkaJsonObject: {result_name(result)}."
+            )
 
     def to_python(self) -> dict:
         result_dict = {}
         iter_handle = CHakkaObjectIter()
-        result = _create_object_iter_begin_func(
-            self._c_hakka_handle, byref(iter_handle)
-        )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to create iterator: {result.name}.")
+        result = _create_object_iter_begin_func(self._c_hakka_handle, iter_handle)
+        if result:
+            raise RuntimeError(f"Failed to create iterator: {result_name(result)}.")
 
         try:
             while True:
                 key_handle = CHakkaHandle()
                 value_handle = CHakkaHandle()
                 iter_result = _get_object_iter_deref_func(
-                    iter_handle, byref(key_handle), byref(value_handle)
+                    iter_handle, key_handle, value_handle
                 )
-                if iter_result == HakkaJsonResultEnum.HAKKA_JSON_ITERATOR_END:
+                if iter_result == _ITERATOR_END:
                     break
-                elif iter_result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+                elif iter_result:
                     raise RuntimeError(
-                        f"Iterator dereference failed: {iter_result.name}."
+                        f"Iterator dereference failed: {result_name(iter_result)}."
                     )
 
                 key_obj = handle_to_object(key_handle).to_python()
@@ -144,12 +149,14 @@ class HakkaJsonObject(HakkaJsonBase):
                 result_dict[key_obj] = value_obj
 
                 move_result = _move_object_iter_next_func(iter_handle)
-                if move_result == HakkaJsonResultEnum.HAKKA_JSON_ITERATOR_END:
+                if move_result == _ITERATOR_END:
                     break
-                elif move_result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-                    raise RuntimeError(f"Iterator move failed: {move_result.name}.")
+                elif move_result:
+                    raise RuntimeError(
+                        f"Iterator move failed: {result_name(move_result)}."
+                    )
         finally:
-            _release_object_iter_func(byref(iter_handle))
+            _release_object_iter_func(iter_handle)
 
         return result_dict
 
@@ -159,26 +166,29 @@ class HakkaJsonObject(HakkaJsonBase):
             raise TypeError("from_python expects a dict.")
         return HakkaJsonObject(py_dict)
 
-    def dumps(self, max_depth: int = 512) -> str:
+    def _dump_buffer(
+        self, max_depth: int, allocate: Optional[BufferAllocator] = None
+    ) -> memoryview:
         buffer_size = c_uint64()
         # _dump_size_object_func
-        result = _dump_size_object_func(self._c_hakka_handle, byref(buffer_size))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to get dump size: {result.name}.")
-
-        buffer = (c_uint8 * buffer_size.value)()
-        result = _dump_object_func(
-            self._c_hakka_handle, c_uint32(max_depth), buffer, byref(buffer_size)
-        )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to dump HakkaJsonObject: {result.name}.")
-        return bytes(buffer[: buffer_size.value]).decode("utf-8")
+        result = _dump_size_object_func(self._c_hakka_handle, buffer_size)
+        if result:
+            raise RuntimeError(f"Failed to get dump size: {result_name(result)}.")
+
+        size = buffer_size.value
+        buffer = allocate(size) if allocate is not None else (c_uint8 * size)()
+        result = _dump_object_func(self._c_hakka_handle, max_depth, buffer, buffer_size)
+        if result:
+            raise RuntimeError(
+                f"Failed to dump HakkaJsonObject: {result_name(result)}."
+            )
+        return memoryview(buffer).cast("B")[: buffer_size.value]
 
     def __len__(self) -> int:
         size = c_uint32()
-        result = _get_object_size_func(self._c_hakka_handle, byref(size))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to get size: {result.name}.")
+        result = _get_object_size_func(self._c_hakka_handle, size)
+        if result:
+            raise RuntimeError(f"Failed to get size: {result_name(result)}.")
         return size.value
 
     def __getitem__(self, key: str) -> Any:
@@ -186,12 +196,12 @@ class HakkaJsonObject(HakkaJsonBase):
         key_buffer, key_length = self._encode_key(key)
         value_handle = CHakkaHandle()
         result = _get_object_object_func(
-            self._c_hakka_handle, key_buffer, key_length, byref(value_handle)
+            self._c_hakka_handle, key_buffer, key_length, value_handle
         )
-        if result == HakkaJsonResultEnum.HAKKA_JSON_KEY_NOT_FOUND:
+        if result == _KEY_NOT_FOUND:
             raise KeyError(key)
-        elif result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Get item failed: {result.name}.")
+        elif result:
+            raise RuntimeError(f"Get item failed: {result_name(result)}.")
         return handle_to_object(value_handle)
 
     def __setitem__(self, key: str, value: Any):
@@ -199,33 +209,51 @@ class HakkaJsonObject(HakkaJsonBase):
         key_buffer, key_length = self._encode_key(key)
         value_obj = (
             obj_from_python(value)
-            if not issubclass(type(value), HakkaJsonBase)
+            if not isinstance(value, HakkaJsonBase)
             else value
         )
         result = _set_object_func(
             self._c_hakka_handle, key_buffer, key_length, value_obj._c_hakka_handle
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Set item failed: {result.name}.")
+        if result:
+            raise RuntimeError(f"Set item failed: {result_name(result)}.")
+
+    def _set_items(self, mapping: dict):
+        """
+        Insert every key/value pair of a dict, with the per-key helpers bound
+        once for the whole batch instead of going through __setitem__.
+        """
+        handle = self._c_hakka_handle
+        encode_key = self._encode_key
+        set_object = _set_object_func
+        for key, value in mapping.items():
+            if not isinstance(key, str):
+                raise TypeError("Keys must be strings.")
+            key_buffer, key_length = encode_key(key)
+            if not isinstance(value, HakkaJsonBase):
+                value = obj_from_python(value)
+            result = set_object(handle, key_buffer, key_length, value._c_hakka_handle)
+            if result:
+                raise RuntimeError(f"Set item failed: {result_name(result)}.")
 
     def __delitem__(self, key: str):
         self._validate_key(key)
         key_buffer, key_length = self._encode_key(key)
         result = _remove_object_key_func(self._c_hakka_handle, key_buffer, key_length)
-        if result == HakkaJsonResultEnum.HAKKA_JSON_KEY_NOT_FOUND:
+        if result == _KEY_NOT_FOUND:
             raise KeyError(key)
-        elif result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Delete item failed: {result.name}.")
+        elif result:
+            raise RuntimeError(f"Delete item failed: {result_name(result)}.")
 
     def __contains__(self, key: str) -> bool:
         self._validate_key(key)
         key_buffer, key_length = self._encode_key(key)
         result_bool = c_uint8()
         result = _contains_object_key_func(
-            self._c_hakka_handle, key_buffer, key_length, byref(result_bool)
+            self._c_hakka_handle, key_buffer, key_length, result_bool
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Contains check failed: {result.name}.")
+        if result:
+            raise RuntimeError(f"Contains check failed: {result_name(result)}.")
         return bool(result_bool.value)
 
     def __iter__(self):
@@ -248,31 +276,31 @@ class HakkaJsonObject(HakkaJsonBase):
         key_buffer, key_length = self._encode_key(key)
         value_handle = CHakkaHandle()
         result = _pop_object_func(
-            self._c_hakka_handle, key_buffer, key_length, byref(value_handle)
+            self._c_hakka_handle, key_buffer, key_length, value_handle
         )
-        if result == HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        if not result:
             return handle_to_object(value_handle)
-        elif result == HakkaJsonResultEnum.HAKKA_JSON_KEY_NOT_FOUND:
+        elif result == _KEY_NOT_FOUND:
             if default is not None:
                 return default
             raise KeyError(key)
         else:
-            raise RuntimeError(f"Pop failed: {result.name}.")
+            raise RuntimeError(f"Pop failed: {result_name(result)}.")
 
     def popitem(self) -> Tuple[str, Any]:
         key_handle = CHakkaHandle()
         value_handle = CHakkaHandle()
         result = _pop_item_object_func(
-            self._c_hakka_handle, byref(key_handle), byref(value_handle)
+            self._c_hakka_handle, key_handle, value_handle
         )
-        if result == HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        if not result:
             key = handle_to_object(key_handle).to_python()
             value = handle_to_object(value_handle)
             return key, value
-        elif result == HakkaJsonResultEnum.HAKKA_JSON_KEY_NOT_FOUND:
+        elif result == _KEY_NOT_FOUND:
             raise KeyError("popitem(): dictionary is empty")
         else:
-            raise RuntimeError(f"Popitem failed: {result.name}.")
+            raise RuntimeError(f"Popitem failed: {result_name(result)}.")
 
     def keys(self) -> Iterable[str]:
         return self.__iter__()
@@ -303,15 +331,15 @@ class HakkaJsonObject(HakkaJsonBase):
             self._c_hakka_handle,
             other_obj._c_hakka_handle,  # pylint: disable=protected-access
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Update failed: {result.name}.")
+        if result:
+            raise RuntimeError(f"Update failed: {result_name(result)}.")
         if kwargs:
             self.update(kwargs)
 
     def clear(self):
         result = _clear_object_func(self._c_hakka_handle)
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Clear failed: {result.name}.")
+        if result:
+            raise RuntimeError(f"Clear failed: {result_name(result)}.")
 
     def copy(self) -> "HakkaJsonObject":
         return HakkaJsonObject(self)
@@ -326,17 +354,17 @@ class HakkaJsonObject(HakkaJsonBase):
 
         value_obj = (
             obj_from_python(value)
-            if not issubclass(type(value), HakkaJsonBase)
+            if not isinstance(value, HakkaJsonBase)
             else value
         )
         result_handle = CHakkaHandle()
         result = _create_object_from_keys_func(
             keys_array._c_hakka_handle,  # pylint: disable=protected-access
             value_obj._c_hakka_handle,  # pylint: disable=protected-access
-            byref(result_handle),
+            result_handle,
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"fromkeys() failed: {result.name}.")
+        if result:
+            raise RuntimeError(f"fromkeys() failed: {result_name(result)}.")
         return handle_to_object(result_handle)
 
     def __repr__(self) -> str:
@@ -373,10 +401,10 @@ class HakkaJsonObject(HakkaJsonBase):
         result = _compare_func(
             self._c_hakka_handle,
             other._c_hakka_handle,  # pylint: disable=protected-access
-            byref(comparison_result),
+            comparison_result,
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Comparison failed: {result.name}.")
+        if result:
+            raise RuntimeError(f"Comparison failed: {result_name(result)}.")
         return op(comparison_result.value, 0)
 
     def __or__(self, other):
@@ -500,57 +528,56 @@ class HakkaJsonObject(HakkaJsonBase):
         """
         self.__init__(state)
 
-    def __dir__(self):
-        return super().__dir__() + [
-            "__init__",
-            "loads",
-            "_construct",
-            "_handle_load_error",
-            "to_python",
-            "from_python",
-            "dump",
-            "__len__",
-            "__getitem__",
-            "__setitem__",
-            "__delitem__",
-            "__contains__",
-            "__iter__",
-            "get",
-            "setdefault",
-            "pop",
-            "popitem",
-            "keys",
-            "values",
-            "items",
-            "update",
-            "clear",
-            "copy",
-            "fromkeys",
-            "__repr__",
-            "__str__",
-            "__eq__",
-            "__ne__",
-            "__lt__",
-            "__le__",
-            "__gt__",
-            "__ge__",
-            "_compare",
-            "__or__",
-            "__ior__",
-            "__hash__",
-            "__reduce__",
-            "_validate_key",
-            "_encode_key",
-            "__class__",
-            "__class_getitem__",
-            "__format__",
-            "__sizeof__",
-            "__getnewargs_ex__",
-            "__getnewargs__",
-            "__reduce_ex__",
-            "__setstate__",
-            "__dir__",
-        ]
+    _DIR = HakkaJsonBase._DIR + (
+        "__init__",
+        "loads",
+        "_construct",
+        "_handle_load_error",
+        "to_python",
+        "from_python",
+        "__len__",
+        "__getitem__",
+        "__setitem__",
+        "_set_items",
+        "__delitem__",
+        "__contains__",
+        "__iter__",
+        "get",
+        "setdefault",
+        "pop",
+        "popitem",
+        "keys",
+        "values",
+        "items",
+        "update",
+        "clear",
+        "copy",
+        "fromkeys",
+        "__repr__",
+        "__str__",
+        "__eq__",
+        "__ne__",
+        "__lt__",
+        "__le__",
+        "__gt__",
+        "__ge__",
+        "_compare",
+        "__or__",
+        "__ior__",
+        "__hash__",
+        "__reduce__",
+        "_validate_key",
+        "_encode_key",
+        "__class__",
+        "__class_getitem__",
+        "__format__",
+        "__sizeof__",
+        "__getnewargs_ex__",
+        "__getnewargs__",
+        "__reduce_ex__",
+        "__setstate__",
+        "__dir__",
+    )
 
 
 class HakkaJsonObjectIterator:
@@ -562,11 +589,9 @@ class HakkaJsonObjectIterator:
 
     def __init__(self, hakka_obj: HakkaJsonObject):
         self._c_iter = CHakkaObjectIter()
-        result = _create_object_iter_begin_func(
-            hakka_obj._c_hakka_handle, byref(self._c_iter)
-        )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Iterator creation failed: {result.name}.")
+        result = _create_object_iter_begin_func(hakka_obj._c_hakka_handle, self._c_iter)
+        if result:
+            raise RuntimeError(f"Iterator creation failed: {result_name(result)}.")
         self._end = False
 
     def __iter__(self):
@@ -578,32 +603,35 @@ class HakkaJsonObjectIterator:
         key_handle = CHakkaHandle()
         value_handle = CHakkaHandle()
         result = _get_object_iter_deref_func(
-            self._c_iter, byref(key_handle), byref(value_handle)
+            self._c_iter, key_handle, value_handle
         )
-        if result == HakkaJsonResultEnum.HAKKA_JSON_ITERATOR_END:
+        if result == _ITERATOR_END:
             self._end = True
             raise StopIteration
-        elif result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Iterator dereference failed: {result.name}.")
+        elif result:
+            raise RuntimeError(f"Iterator dereference failed: {result_name(result)}.")
 
         move_result = _move_object_iter_next_func(self._c_iter)
-        if move_result == HakkaJsonResultEnum.HAKKA_JSON_ITERATOR_END:
+        if move_result == _ITERATOR_END:
             self._end = True
-        elif move_result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Iterator move failed: {move_result.name}.")
+        elif move_result:
+            raise RuntimeError(f"Iterator move failed: {result_name(move_result)}.")
 
         key_obj = handle_to_object(key_handle).to_python()
         return key_obj
 
     def __del__(self):
-        if hasattr(self, "_c_iter") and self._c_iter:
-            result = _release_object_iter_func(byref(self._c_iter))
-            if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        c_iter = getattr(self, "_c_iter", None)
+        if c_iter:
+            result = _release_object_iter_func(c_iter)
+            if result:
                 import warnings
 
                 warnings.warn(
-                    f"Iterator release failed: {result.name}.", ResourceWarning
+                    f"Iterator release failed: {result_name(result)}.", ResourceWarning
                 )
 
+    _DIR = ("__iter__", "__next__", "__del__")
+
     def __dir__(self):
-        return ["__iter__", "__next__", "__del__"]
+        return self._DIR
@@ -6,13 +6,14 @@ HakkaJsonString class definition.
 Represents a JSON string value in HakkaJson.
 """
 
-from ctypes import byref, c_uint32, c_uint8, c_int64, c_ubyte, c_uint64, c_int32
+import codecs
+from ctypes import c_uint32, c_uint8, c_int64, c_ubyte, c_uint64, c_int32
 from typing import Union
 import re
 
 from ._hakka_json_base import HakkaJsonBase, HakkaJsonIteratorBase
 from ._hakka_json_loader import CHakkaHandle, CHakkaStringIter, dispatch_table
-from ._hakka_json_enum import HakkaJsonResultEnum, HakkaJsonTypeEnum
+from ._hakka_json_enum import HakkaJsonResultEnum, HakkaJsonTypeEnum, result_name
 from ._hakka_json_type_dispatcher import handle_to_object
 
 __all__ = ["HakkaJsonString"]
@@ -74,6 +75,9 @@ _string_iter_release_func = dispatch_table["HakkaStringIterRelease"]
 _compare_func = dispatch_table["HakkaCompare"]
 _hash_func = dispatch_table["HakkaHash"]
 
+# Raw result code returned by the string iterator at the end (restype c_int).
+_ITERATOR_END = HakkaJsonResultEnum.HAKKA_JSON_ITERATOR_END.value
+
 
 class HakkaJsonString(HakkaJsonBase):
     """
@@ -101,9 +105,11 @@ class HakkaJsonString(HakkaJsonBase):
         c_hakka_handle = CHakkaHandle()
         # Create a ctypes array from utf8_bytes
         byte_array = (c_uint8 * len(utf8_bytes)).from_buffer_copy(utf8_bytes)
-        result = _create_string_func(byref(c_hakka_handle), byte_array, length)
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to create HakkaJsonString {result.name}.")
+        result = _create_string_func(c_hakka_handle, byte_array, length)
+        if result:
+            raise RuntimeError(
+                f"Failed to create HakkaJsonString {result_name(result)}."
+            )
         return c_hakka_handle
 
     def __init__(self, value: str):
@@ -142,10 +148,10 @@ class HakkaJsonString(HakkaJsonBase):
             RuntimeError: If the C API call fails.
         """
         length = c_uint64()
-        result = _get_string_utf8_length_func(self._c_hakka_handle, byref(length))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        result = _get_string_utf8_length_func(self._c_hakka_handle, length)
+        if result:
             raise RuntimeError(
-                f"Failed to get UTF-8 length of HakkaJsonString {result.name}."
+                f"Failed to get UTF-8 length of HakkaJsonString {result_name(result)}."
             )
         return length.value
 
@@ -162,11 +168,12 @@ class HakkaJsonString(HakkaJsonBase):
         buffer_size = c_uint32(self._utf8_length() + 1)
         # Allocate buffer
         buffer = (c_uint8 * buffer_size.value)()
-        result = _get_string_func(self._c_hakka_handle, buffer, byref(buffer_size))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        result = _get_string_func(self._c_hakka_handle, buffer, buffer_size)
+        if result:
             raise RuntimeError("Failed to get string from HakkaJsonString.")
-        utf8_bytes = bytes(buffer[: buffer_size.value])
-        return utf8_bytes.decode("utf-8")
+        # Decode straight from the ctypes buffer, without an intermediate bytes.
+        with memoryview(buffer) as view, view[: buffer_size.value] as utf8:
+            return codecs.utf_8_decode(utf8, None, True)[0]
 
     def __str__(self) -> str:
         """
@@ -191,8 +198,8 @@ class HakkaJsonString(HakkaJsonBase):
             RuntimeError: If the C API call fails.
         """
         length = c_uint32()
-        result = _get_string_length_func(self._c_hakka_handle, byref(length))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        result = _get_string_length_func(self._c_hakka_handle, length)
+        if result:
             raise RuntimeError("Failed to get length of HakkaJsonString.")
         return length.value
 
@@ -246,9 +253,9 @@ class HakkaJsonString(HakkaJsonBase):
             c_start,
             c_stop,
             c_step,
-            byref(result_handle),
+            result_handle,
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        if result:
             raise RuntimeError("Failed to slice HakkaJsonString.")
         return HakkaJsonString.from_handle(result_handle)
 
@@ -293,9 +300,9 @@ class HakkaJsonString(HakkaJsonBase):
             self._c_hakka_handle,
             byte_array,
             other_length,
-            byref(result_handle),
+            result_handle,
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        if result:
             raise RuntimeError("Failed to concatenate strings.")
         return HakkaJsonString.from_handle(result_handle)
 
@@ -332,9 +339,9 @@ class HakkaJsonString(HakkaJsonBase):
 
         result_handle = CHakkaHandle()
         result = _get_string_multiply_func(
-            self._c_hakka_handle, c_int64(n), byref(result_handle)
+            self._c_hakka_handle, c_int64(n), result_handle
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        if result:
             raise RuntimeError("Failed to multiply string.")
         return HakkaJsonString.from_handle(result_handle)
 
@@ -379,8 +386,8 @@ class HakkaJsonString(HakkaJsonBase):
             RuntimeError: If the C API call fails.
         """
         hash_value = c_uint64()
-        result = _hash_func(self._c_hakka_handle, byref(hash_value))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        result = _hash_func(self._c_hakka_handle, hash_value)
+        if result:
             raise RuntimeError("Failed to compute hash for HakkaJsonString.")
         return hash_value.value
 
@@ -425,10 +432,8 @@ class HakkaJsonString(HakkaJsonBase):
         other_handle = other_hakka._c_hakka_handle  # pylint: disable=protected-access
 
         comparison_result = c_int32()
-        result = _compare_func(
-            self._c_hakka_handle, other_handle, byref(comparison_result)
-        )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        result = _compare_func(self._c_hakka_handle, other_handle, comparison_result)
+        if result:
             raise RuntimeError("Comparison failed.")
         return op(comparison_result.value, 0)
 
@@ -554,8 +559,8 @@ class HakkaJsonString(HakkaJsonBase):
             raise TypeError("zfill() integer argument required")
         method = _string_methods["zfill"]
         result_handle = CHakkaHandle()
-        result = method(self._c_hakka_handle, c_int64(width), byref(result_handle))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        result = method(self._c_hakka_handle, c_int64(width), result_handle)
+        if result:
             raise RuntimeError("Failed to zfill HakkaJsonString.")
         return HakkaJsonString.from_handle(result_handle)
 
@@ -598,9 +603,9 @@ class HakkaJsonString(HakkaJsonBase):
             old_length,
             (c_uint8 * len(new_bytes)).from_buffer_copy(new_bytes),
             new_length,
-            byref(result_handle),
+            result_handle,
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        if result:
             raise RuntimeError("Failed to replace in HakkaJsonString.")
         # If 'count' is specified and valid, apply it by repeating the replace operation.
         if count != -1:
@@ -634,9 +639,9 @@ class HakkaJsonString(HakkaJsonBase):
             self._c_hakka_handle,
             (c_uint8 * len(prefix_bytes)).from_buffer_copy(prefix_bytes),
             prefix_length,
-            byref(result_handle),
+            result_handle,
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        if result:
             raise RuntimeError("Failed to remove prefix.")
         return HakkaJsonString.from_handle(result_handle)
 
@@ -664,9 +669,9 @@ class HakkaJsonString(HakkaJsonBase):
             self._c_hakka_handle,
             (c_uint8 * len(suffix_bytes)).from_buffer_copy(suffix_bytes),
             suffix_length,
-            byref(result_handle),
+            result_handle,
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        if result:
             raise RuntimeError("Failed to remove suffix.")
         return HakkaJsonString.from_handle(result_handle)
 
@@ -685,10 +690,10 @@ class HakkaJsonString(HakkaJsonBase):
         """
         method = _string_methods[method_name]
         result_handle = CHakkaHandle()
-        result = method(self._c_hakka_handle, byref(result_handle))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        result = method(self._c_hakka_handle, result_handle)
+        if result:
             raise RuntimeError(
-                f"Failed to {method_name} HakkaJsonString {result.name}."
+                f"Failed to {method_name} HakkaJsonString {result_name(result)}."
             )
         return HakkaJsonString.from_handle(result_handle)
 
@@ -745,9 +750,11 @@ class HakkaJsonString(HakkaJsonBase):
         """
         method = _string_tests[test_name]
         result_bool = c_ubyte()
-        result = method(self._c_hakka_handle, byref(result_bool))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to {test_name} HakkaJsonString {result.name}.")
+        result = method(self._c_hakka_handle, result_bool)
+        if result:
+            raise RuntimeError(
+                f"Failed to {test_name} HakkaJsonString {result_name(result)}."
+            )
         return result_bool.value
 
     # Additional String Methods
@@ -799,11 +806,11 @@ class HakkaJsonString(HakkaJsonBase):
             sliced._c_hakka_handle,  # pylint: disable=protected-access
             byte_array,
             sub_length,
-            byref(count),
+            count,
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        if result:
             raise RuntimeError(
-                f"Failed to count occurrences in HakkaJsonString {result.name}."
+                f"Failed to count occurrences in HakkaJsonString {result_name(result)}."
             )
         return count.value
 
@@ -838,10 +845,10 @@ class HakkaJsonString(HakkaJsonBase):
             sliced._c_hakka_handle,  # pylint: disable=protected-access
             byte_array,
             sub_length,
-            byref(position),
+            position,
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to find substring: {result.name}.")
+        if result:
+            raise RuntimeError(f"Failed to find substring: {result_name(result)}.")
         return position.value
 
     def rfind(self, sub: str, start: int = 0, end: int = -1) -> int:
@@ -879,10 +886,10 @@ class HakkaJsonString(HakkaJsonBase):
             sliced._c_hakka_handle,  # pylint: disable=protected-access
             byte_array,
             sub_length,
-            byref(position),
+            position,
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to rfind substring: {result.name}.")
+        if result:
+            raise RuntimeError(f"Failed to rfind substring: {result_name(result)}.")
         return position.value
 
     def finditer(self, sub: str, start: int = 0, end: int = -1):
@@ -1012,10 +1019,12 @@ class HakkaJsonString(HakkaJsonBase):
             (c_uint8 * len(sep_bytes)).from_buffer_copy(sep_bytes),
             sep_length,
             c_int64(maxsplit),
-            byref(array_handle),
+            array_handle,
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to split HakkaJsonString {result.name}.")
+        if result:
+            raise RuntimeError(
+                f"Failed to split HakkaJsonString {result_name(result)}."
+            )
         return handle_to_object(array_handle)
 
     def rsplit(self, sep=None, maxsplit=-1) -> "HakkaJsonArray":
@@ -1048,10 +1057,12 @@ class HakkaJsonString(HakkaJsonBase):
             (c_uint8 * len(sep_bytes)).from_buffer_copy(sep_bytes),
             sep_length,
             c_int64(maxsplit),
-            byref(array_handle),
+            array_handle,
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to rsplit HakkaJsonString {result.name}.")
+        if result:
+            raise RuntimeError(
+                f"Failed to rsplit HakkaJsonString {result_name(result)}."
+            )
         return handle_to_object(array_handle)
 
     def splitlines(self, keepends: bool = False) -> "HakkaJsonArray":
@@ -1073,10 +1084,12 @@ class HakkaJsonString(HakkaJsonBase):
 
         array_handle = CHakkaHandle()
         result = _get_string_splitlines_func(
-            self._c_hakka_handle, c_uint8(keepends), byref(array_handle)
+            self._c_hakka_handle, c_uint8(keepends), array_handle
         )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to splitlines HakkaJsonString {result.name}.")
+        if result:
+            raise RuntimeError(
+                f"Failed to splitlines HakkaJsonString {result_name(result)}."
+            )
         return handle_to_object(array_handle)
 
     def startswith(self, prefix: str, start: int = 0, end: int = None) -> bool:
@@ -1113,11 +1126,11 @@ class HakkaJsonString(HakkaJsonBase):
             sliced._c_hakka_handle,  # pylint: disable=protected-access
             (c_uint8 * len(prefix_bytes)).from_buffer_copy(prefix_bytes),
             prefix_length,
-            byref(result_bool),
+            result_bool,
         )
 
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to execute startswith {result.name}.")
+        if result:
+            raise RuntimeError(f"Failed to execute startswith {result_name(result)}.")
 
         return result_bool.value
 
@@ -1155,11 +1168,11 @@ class HakkaJsonString(HakkaJsonBase):
             sliced._c_hakka_handle,  # pylint: disable=protected-access
             (c_uint8 * len(suffix_bytes)).from_buffer_copy(suffix_bytes),
             suffix_length,
-            byref(result_bool),
+            result_bool,
         )
 
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-            raise RuntimeError(f"Failed to execute endswith {result.name}.")
+        if result:
+            raise RuntimeError(f"Failed to execute endswith {result_name(result)}.")
 
         return result_bool.value
 
@@ -1240,87 +1253,86 @@ class HakkaJsonString(HakkaJsonBase):
         """
         return HakkaJsonString(self.to_python().translate(table))
 
-    def __dir__(self):
-        return super().__dir__() + [
-            "_construct",
-            "__init__",
-            "_utf8_length",
-            "to_python",
-            "__str__",
-            "__repr__",
-            "__len__",
-            "__getitem__",
-            "_slice",
-            "from_handle",
-            "__add__",
-            "__radd__",
-            "__mul__",
-            "__rmul__",
-            "__contains__",
-            "__iter__",
-            "__hash__",
-            "__eq__",
-            "__ne__",
-            "__lt__",
-            "__le__",
-            "__gt__",
-            "__ge__",
-            "_compare",
-            "__mod__",
-            "__rmod__",
-            "__getnewargs__",
-            "__getstate__",
-            "__setstate__",
-            "__copy__",
-            "__deepcopy__",
-            "capitalize",
-            "casefold",
-            "lower",
-            "upper",
-            "swapcase",
-            "title",
-            "zfill",
-            "replace",
-            "removeprefix",
-            "removesuffix",
-            "_string_method",
-            "isalnum",
-            "isalpha",
-            "isascii",
-            "isdecimal",
-            "isdigit",
-            "isidentifier",
-            "islower",
-            "isnumeric",
-            "isprintable",
-            "isspace",
-            "istitle",
-            "isupper",
-            "_string_test",
-            "center",
-            "count",
-            "find",
-            "rfind",
-            "finditer",
-            "format",
-            "format_map",
-            "encode",
-            "expandtabs",
-            "join",
-            "split",
-            "rsplit",
-            "splitlines",
-            "startswith",
-            "endswith",
-            "partition",
-            "rpartition",
-            "ljust",
-            "rindex",
-            "rindexiter",
-            "maketrans",
-            "translate",
-            "__dir__",
-        ]
+    _DIR = HakkaJsonBase._DIR + (
+        "_construct",
+        "__init__",
+        "_utf8_length",
+        "to_python",
+        "__str__",
+        "__repr__",
+        "__len__",
+        "__getitem__",
+        "_slice",
+        "from_handle",
+        "__add__",
+        "__radd__",
+        "__mul__",
+        "__rmul__",
+        "__contains__",
+        "__iter__",
+        "__hash__",
+        "__eq__",
+        "__ne__",
+        "__lt__",
+        "__le__",
+        "__gt__",
+        "__ge__",
+        "_compare",
+        "__mod__",
+        "__rmod__",
+        "__getnewargs__",
+        "__getstate__",
+        "__setstate__",
+        "__copy__",
+        "__deepcopy__",
+        "capitalize",
+        "casefold",
+        "lower",
+        "upper",
+        "swapcase",
+        "title",
+        "zfill",
+        "replace",
+        "removeprefix",
+        "removesuffix",
+        "_string_method",
+        "isalnum",
+        "isalpha",
+        "isascii",
+        "isdecimal",
+        "isdigit",
+        "isidentifier",
+        "islower",
+        "isnumeric",
+        "isprintable",
+        "isspace",
+        "istitle",
+        "isupper",
+        "_string_test",
+        "center",
+        "count",
+        "find",
+        "rfind",
+        "finditer",
+        "format",
+        "format_map",
+        "encode",
+        "expandtabs",
+        "join",
+        "split",
+        "rsplit",
+        "splitlines",
+        "startswith",
+        "endswith",
+        "partition",
+        "rpartition",
+        "ljust",
+        "rindex",
+        "rindexiter",
+        "maketrans",
+        "translate",
+        "__dir__",
+    )
 
 
 class HakkaJsonStringIterator(HakkaJsonIteratorBase):
@@ -1342,10 +1354,8 @@ class HakkaJsonStringIterator(HakkaJsonIteratorBase):
             RuntimeError: If the C API call fails.
         """
         self._c_iter = CHakkaStringIter()
-        result = _create_string_begin_func(
-            hakka_string._c_hakka_handle, byref(self._c_iter)
-        )
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        result = _create_string_begin_func(hakka_string._c_hakka_handle, self._c_iter)
+        if result:
             raise RuntimeError("Failed to create string iterator.")
         self._end = False
 
@@ -1373,15 +1383,15 @@ class HakkaJsonStringIterator(HakkaJsonIteratorBase):
             self.__del__()
             raise StopIteration
         utf32_char = c_uint32()
-        result = _get_string_deref_func(self._c_iter, byref(utf32_char))
-        if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        result = _get_string_deref_func(self._c_iter, utf32_char)
+        if result:
             self.__del__()
             raise RuntimeError("Failed to dereference iterator.")
         char = chr(utf32_char.value)
         result = _move_string_next_func(self._c_iter)
-        if result == HakkaJsonResultEnum.HAKKA_JSON_ITERATOR_END:
+        if result == _ITERATOR_END:
             self._end = True
-        elif result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
+        elif result:
             self.__del__()
             raise RuntimeError("Failed to advance iterator.")
         return char
@@ -1390,9 +1400,12 @@ class HakkaJsonStringIterator(HakkaJsonIteratorBase):
         """
         Clean up the iterator by releasing resources.
         """
-        if hasattr(self, "_c_iter") and self._c_iter:
-            _string_iter_release_func(byref(self._c_iter))
+        c_iter = getattr(self, "_c_iter", None)
+        if c_iter:
+            _string_iter_release_func(c_iter)
             self._c_iter = None
 
+    _DIR = ("__init__", "__iter__", "__next__", "__del__", "__dir__")
+
     def __dir__(self):
-        return ["__init__", "__iter__", "__next__", "__del__", "__dir__"]
+        return self._DIR
@@ -5,7 +5,7 @@ Converts pure Python objects to HakkaJson objects.
 """
 
 from typing import Union
-from ctypes import c_uint32, byref
+from ctypes import c_uint32
 
 from ._hakka_json_null import HakkaJsonNull
 from ._hakka_json_int import HakkaJsonInt
@@ -15,10 +15,15 @@ from ._hakka_json_invalid import HakkaJsonInvalid
 from ._hakka_json_base import HakkaJsonBase
 
 from ._hakka_json_loader import CHakkaHandle, dispatch_table
-from ._hakka_json_enum import HakkaJsonResultEnum, HakkaJsonTypeEnum
+from ._hakka_json_enum import HakkaJsonTypeEnum, result_name
 
 
-__all__ = ["obj_from_python", "handle_to_object", "normalize_to_native"]
+__all__ = [
+    "obj_from_python",
+    "handle_to_object",
+    "handle_to_typed_object",
+    "normalize_to_native",
+]
 
 _hakka_type = dispatch_table["HakkaType"]
 _release_func = dispatch_table["HakkaRelease"]
@@ -116,16 +121,43 @@ def handle_to_object(
     Returns:
         HakkaJsonBase: The corresponding HakkaJson object.
     """
-    _staic_imports()
-
     type_id = c_uint32(-1)
-    result = _hakka_type(handle, byref(type_id))
-    if result != HakkaJsonResultEnum.HAKKA_JSON_SUCCESS:
-        _release_func(byref(handle))
-        raise RuntimeError(f"Failed to get type of HakkaJson object {result.name}.")
+    result = _hakka_type(handle, type_id)
+    if result:
+        _release_func(handle)
+        raise RuntimeError(
+            f"Failed to get type of HakkaJson object {result_name(result)}."
+        )
+    return handle_to_typed_object(handle, type_id.value)
+
+
+def handle_to_typed_object(
+    handle: CHakkaHandle,
+    type_id: int,
+) -> Union[
+    HakkaJsonInvalid,
+    HakkaJsonNull,
+    HakkaJsonBool,
+    HakkaJsonInt,
+    HakkaJsonFloat,
+    "HakkaJsonString",
+    "HakkaJsonArray",
+    "HakkaJsonObject",
+]:  # pylint: disable=too-many-return-statements
+    """
+    Convert a CHakkaHandle whose type is already known to a HakkaJson object.
+
+    Args:
+        handle (CHakkaHandle): The handle to convert.
+        type_id (int): The HakkaJsonTypeEnum value reported by HakkaType.
+
+    Returns:
+        HakkaJsonBase: The corresponding HakkaJson object.
+    """
+    _staic_imports()
 
     base = HakkaJsonBase(handle)
-    match HakkaJsonTypeEnum(type_id.value):
+    match HakkaJsonTypeEnum(type_id):
         case HakkaJsonTypeEnum.HAKKA_JSON_INT:
             return HakkaJsonInt(base)
         case HakkaJsonTypeEnum.HAKKA_JSON_FLOAT:
@@ -143,8 +175,8 @@ def handle_to_object(
         case HakkaJsonTypeEnum.HAKKA_JSON_INVALID:
             return HakkaJsonInvalid()
         case _:
-            _release_func(byref(handle))
-            raise RuntimeError(f"Unsupported HakkaJson type {type_id.value}.")
+            _release_func(handle)
+            raise RuntimeError(f"Unsupported HakkaJson type {type_id}.")
     return HakkaJsonInvalid()
 
 
@@ -1,7 +1,9 @@
+import tempfile
 import unittest
-from io import StringIO
+from io import BytesIO, StringIO
 from py_hakka_json._hakka_json import HakkaJson
 from py_hakka_json._hakka_json_array import HakkaJsonArray
+from py_hakka_json._hakka_json_base import _DumpBufferPool
 from py_hakka_json._hakka_json_object import HakkaJsonObject
 
 
@@ -22,6 +24,34 @@ class TestHakkaJson(unittest.TestCase):
         file.seek(0)
         self.assertEqual(file.read(), '{"key": "value"}')
 
+    def test_dump_binary_file(self):
+        file = BytesIO()
+        HakkaJson.dump(self.json_object, file)
+        self.assertEqual(file.getvalue(), b'{"key": "value"}')
+
+    def test_dump_and_load_raw_file(self):
+        with tempfile.TemporaryFile(buffering=0) as file:
+            HakkaJson.dump(self.json_array, file)
+            file.seek(0)
+            result = HakkaJson.load(file)
+        self.assertEqual(result.to_python(), [1, 2, 3])
+
+    def test_load_large_binary_file(self):
+        values = list(range(20000))
+        with tempfile.TemporaryFile() as file:
+            file.write(b"  ")
+            HakkaJson.dump(HakkaJsonArray(values), file)
+            file.seek(2)
+            result = HakkaJson.load(file)
+            self.assertEqual(file.read(), b"")
+        self.assertEqual(result.to_python(), values)
+
+    def test_dump_to_small_chunks(self):
+        chunks = []
+        obj = HakkaJsonObject({"greeting": "你好"})
+        obj.dump_to(chunks.append, chunk_size=1)
+        self.assertEqual("".join(chunks), obj.dumps())
+
     def test_dumps_array(self):
         result = HakkaJson.dumps(self.json_array)
         self.assertEqual(result, "[1, 2, 3]")
@@ -52,6 +82,19 @@ class TestHakkaJson(unittest.TestCase):
         self.assertIsInstance(result, HakkaJsonObject)
         self.assertEqual(result.to_python(), {"key": "value"})
 
+    def test_loads_bytes(self):
+        result = HakkaJson.loads(b"[1, 2, 3]")
+        self.assertIsInstance(result, HakkaJsonArray)
+        self.assertEqual(result.to_python(), [1, 2, 3])
+        result = HakkaJson.loads(memoryview(b' {"key": "value"}'))
+        self.assertIsInstance(result, HakkaJsonObject)
+        self.assertEqual(result.to_python(), {"key": "value"})
+
+    def test_load_binary_file(self):
+        result = HakkaJson.load(BytesIO(b"\n[1, 2, 3]"))
+        self.assertIsInstance(result, HakkaJsonArray)
+        self.assertEqual(result.to_python(), [1, 2, 3])
+
     def test_dump_invalid_type(self):
         with self.assertRaises(TypeError):
             HakkaJson.dump("invalid", StringIO())
@@ -940,5 +983,34 @@ class TestHakkaJsonAdvanced(unittest.TestCase):
         )
 
 
+
+class TestDumpBufferPool(unittest.TestCase):
+    def test_retained_memory_is_bounded(self):
+        pool = _DumpBufferPool()
+        capacity = pool.MIN_CAPACITY
+        while capacity <= pool.MAX_CAPACITY * 2:
+            buffers = [pool.rent(capacity) for _ in range(pool.PER_BUCKET * 2)]
+            for buffer in buffers:
+                pool.give_back(buffer)
+            capacity <<= 1
+        self.assertGreater(pool.retained, 0)
+        self.assertLessEqual(pool.retained, pool.MAX_RETAINED)
+
+    def test_rent_reuses_returned_buffer(self):
+        pool = _DumpBufferPool()
+        buffer = pool.rent(100)
+        pool.give_back(buffer)
+        self.assertIs(pool.rent(100), buffer)
+        self.assertEqual(pool.retained, 0)
+
+    def test_oversized_buffer_is_exact_and_not_retained(self):
+        pool = _DumpBufferPool()
+        size = pool.MAX_CAPACITY + 1
+        buffer = pool.rent(size)
+        self.assertEqual(len(buffer), size)
+        pool.give_back(buffer)
+        self.assertEqual(pool.retained, 0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,10 +1,15 @@
 import unittest
 
 import pickle
+import sys
 from py_hakka_json._hakka_json_bool import HakkaJsonBool
 from py_hakka_json._hakka_json_int import HakkaJsonInt
 from py_hakka_json._hakka_json_string import HakkaJsonString
-from py_hakka_json._hakka_json_array import HakkaJsonArray, HakkaJsonArrayIterator
+from py_hakka_json._hakka_json_array import (
+    HakkaJsonArray,
+    HakkaJsonArrayIterator,
+    _cached_probe,
+)
 from py_hakka_json._hakka_json_object import HakkaJsonObject
 from py_hakka_json._hakka_json_float import HakkaJsonFloat
 
@@ -23,6 +28,13 @@ class TestHakkaJsonArray(unittest.TestCase):
         self.assertEqual(len(array), 3)
         self.assertEqual(array.to_python(), [1, 2, 3])
 
+    def test_dumps_repeated_calls(self):
+        long_array = HakkaJsonArray(["x" * 100, 1, 2])
+        short_array = HakkaJsonArray([1])
+        self.assertEqual(long_array.dumps(), '["' + "x" * 100 + '", 1, 2]')
+        self.assertEqual(short_array.dumps(), "[1]")
+        self.assertEqual(long_array.dumps(), '["' + "x" * 100 + '", 1, 2]')
+
     def test_loads_invalid(self):
         # string is not a valid JSON
         with self.assertRaises(ValueError):
@@ -97,6 +109,14 @@ class TestHakkaJsonArray(unittest.TestCase):
         self.assertTrue(2 in array)
         self.assertFalse(4 in array)
 
+    def test_contains_long_string_is_not_cached(self):
+        array = HakkaJsonArray(["a"])
+        long_value = "x" * 100_000
+        before = _cached_probe.cache_info().currsize
+        self.assertFalse(long_value in array)
+        self.assertEqual(_cached_probe.cache_info().currsize, before)
+        self.assertTrue("a" in array)
+
     def test_clear(self):
         array = HakkaJsonArray([1, 2, 3])
         array.clear()
@@ -476,6 +496,22 @@ class TestHakkaJsonArrayAdvanced(unittest.TestCase):
             current = current[0]
         self.assertEqual(len(current), 0)
 
+    def test_to_python_deeper_than_recursion_limit(self):
+        depth = sys.getrecursionlimit() * 3
+        nested = HakkaJsonArray()
+        current = nested
+        for _ in range(depth):
+            new_array = HakkaJsonArray()
+            current.append(new_array)
+            current = new_array
+        current.append(HakkaJsonInt(7))
+        limit = sys.getrecursionlimit()
+        result = nested.to_python()
+        self.assertEqual(sys.getrecursionlimit(), limit)
+        for _ in range(depth):
+            result = result[0]
+        self.assertEqual(result, [7])
+
     def test_large_array_operations(self):
         large_size = 10000
         large_array = HakkaJsonArray()
@@ -1,5 +1,6 @@
 import unittest
 import pickle
+import threading
 from py_hakka_json._hakka_json_float import HakkaJsonFloat
 
 
@@ -28,6 +29,49 @@ class TestHakkaJsonFloat(unittest.TestCase):
         self.assertTrue(a != b)
         self.assertEqual(a, HakkaJsonFloat(10.0))
 
+    def test_comparison_with_nan(self):
+        nan = HakkaJsonFloat(float("nan"))
+        for other in (1.0, 1, float("nan")):
+            self.assertFalse(nan == other)
+            self.assertTrue(nan != other)
+            self.assertFalse(nan < other)
+            self.assertFalse(nan <= other)
+            self.assertFalse(nan > other)
+            self.assertFalse(nan >= other)
+        self.assertFalse(HakkaJsonFloat(1.0) == float("nan"))
+        self.assertFalse(HakkaJsonFloat(1.0) <= float("nan"))
+
+    def test_comparison_with_large_int(self):
+        big = 10**400
+        a = HakkaJsonFloat(1e308)
+        self.assertFalse(a == big)
+        self.assertTrue(a != big)
+        self.assertTrue(a < big)
+        self.assertTrue(a <= big)
+        self.assertFalse(a > big)
+        self.assertTrue(HakkaJsonFloat(float("inf")) > big)
+        self.assertTrue(HakkaJsonFloat(2.0**53) == 2**53)
+        self.assertFalse(HakkaJsonFloat(2.0**53) == 2**53 + 1)
+
+    def test_lazy_handle_created_once_across_threads(self):
+        value = HakkaJsonFloat(1.25) + 2.5
+        handles = []
+        barrier = threading.Barrier(8)
+
+        def read_handle():
+            barrier.wait()
+            handles.append(value._c_hakka_handle)
+
+        threads = [threading.Thread(target=read_handle) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(handles), 8)
+        for handle in handles:
+            self.assertIs(handle, handles[0])
+        self.assertEqual(value.to_python(), 3.75)
+
     def test_hash(self):
         value = 42.0
         hakka_float1 = HakkaJsonFloat(value)
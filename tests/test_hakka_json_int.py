@@ -33,6 +33,12 @@ class TestHakkaJsonInt(unittest.TestCase):
         hakka_int = HakkaJsonInt(value)
         self.assertEqual(hash(hakka_int), hash(value))
 
+    def test_hash_matches_int_keys(self):
+        value = -(1 << 40)
+        self.assertEqual(hash(HakkaJsonInt(value)), hash(value))
+        self.assertIn(HakkaJsonInt(value), {value: "a"})
+        self.assertIn(value, {HakkaJsonInt(value)})
+
     def test_initialization_with_int(self):
         value = 42
         hakka_int = HakkaJsonInt(value)
@@ -91,6 +97,16 @@ class TestHakkaJsonInt(unittest.TestCase):
         deserialized = pickle.loads(serialized)
         self.assertEqual(deserialized, hakka_int)
 
+    def test_from_iterable(self):
+        values = [0, 1, -5, 256, 1000, -(1 << 63), HakkaJsonInt(7)]
+        result = HakkaJsonInt.from_iterable(values)
+        self.assertEqual(len(result), len(values))
+        for item, value in zip(result, values):
+            self.assertIsInstance(item, HakkaJsonInt)
+            self.assertEqual(item, value)
+        with self.assertRaises(OverflowError):
+            HakkaJsonInt.from_iterable([1 << 63])
+
     def test_from_bytes(self):
         value = 1024
         hakka_int = HakkaJsonInt.from_bytes(
@@ -218,6 +234,13 @@ class TestHakkaJsonInt(unittest.TestCase):
         a.__setstate__(20)
         self.assertEqual(a.to_python(), 20)
 
+    def test_setstate_out_of_range(self):
+        a = HakkaJsonInt(1000)
+        with self.assertRaises(OverflowError):
+            a.__setstate__(2**64 + 5)
+        self.assertEqual(a.to_python(), 1000)
+        self.assertEqual(a.dumps(), "1000")
+
     def test_sizeof(self):
         a = HakkaJsonInt(10)
         self.assertEqual(a.__sizeof__(), 8)
@@ -232,6 +255,13 @@ class TestHakkaJsonInt(unittest.TestCase):
         for name in fun_list:
             self.assertTrue(hasattr(HakkaJsonInt, name))
 
+    def test_dir_instance(self):
+        names = dir(HakkaJsonInt(1))
+        self.assertIn("to_python", names)
+        self.assertIn("_from_int", names)
+        for name in names:
+            self.assertTrue(hasattr(HakkaJsonInt, name))
+
 
 if __name__ == "__main__":
     unittest.main()